@@ -0,0 +1,27 @@
+import pytest
+
+from ui.services.config_storage import ConfigStorageService, SavedConfig
+
+
+@pytest.mark.parametrize("mode, values", [
+    ("tx", dict(
+        tx_config_host="10.0.0.5", tx_node_name="studio", tx_link_name="link1",
+        tx_peer_ip="10.0.0.9", tx_encoding="opus", tx_sample_rate="44100",
+        tx_jitter_buffer="30", tx_audio_backend="alsa",
+    )),
+    ("rx", dict(
+        rx_config_host="10.0.0.5", rx_node_name="remote", rx_link_name="link1",
+        rx_audio_backend="alsa", rx_alsa_device="hw:1",
+    )),
+])
+def test_args_round_trip(tmp_path, mode, values):
+    source = SavedConfig(transmission_mode=mode, **values)
+    args = source.get_current_args()
+    
+    storage = ConfigStorageService(tmp_path)
+    storage.update_from_args(args, mode)
+    
+    parsed = storage.config
+    assert parsed.transmission_mode == mode
+    assert {name: getattr(parsed, name) for name in values} == values
+    assert parsed.get_current_args() == args
@@ -0,0 +1,81 @@
+import pytest
+
+from ui.core.models import AppState
+from ui.main_window import MainWindow
+
+
+class _Var:
+    def set(self, value):
+        self.value = value
+
+
+class _Button:
+    def configure(self, **kwargs):
+        pass
+
+
+class _Controller:
+    def __init__(self, seconds):
+        self.state = AppState()
+        self.state.cooldown_active = True
+        self.state.cooldown_remaining = seconds
+    
+    def tick_cooldown(self):
+        self.state.cooldown_remaining -= 1
+        if self.state.cooldown_remaining <= 0:
+            self.state.cooldown_active = False
+
+
+def _make_window(seconds=0):
+    # Drive MainWindow._tick without Tk: only the cooldown path is real
+    win = MainWindow.__new__(MainWindow)
+    win.controller = _Controller(seconds)
+    win._tick_count = 0
+    win._cooldown_due = None
+    win._last_btn_key = None
+    win._has_real_vu_data = {}
+    win._btn_text_var = _Var()
+    win.main_action_btn = _Button()
+    win._update_vu_from_redis = lambda state: None
+    win._update_status = lambda state: None
+    win._pump_logs = lambda: None
+    win._schedule = lambda delay_ms, callback: None
+    return win
+
+
+def test_cooldown_steps_once_per_second_of_ticks():
+    win = _make_window(5)
+    steps = []
+    tick_cooldown = win.controller.tick_cooldown
+    
+    def record_step():
+        steps.append(win._tick_count - 1)  # tick being processed
+        tick_cooldown()
+    win.controller.tick_cooldown = record_step
+    
+    # Cooldown starts between ticks, after tick 2 fired
+    for _ in range(3):
+        win._tick()
+    win._cooldown_tick(win.controller.state)
+    
+    for _ in range(100):
+        win._tick()
+    
+    assert len(steps) == 5
+    assert [b - a for a, b in zip(steps, steps[1:])] == [MainWindow.COOLDOWN_EVERY] * 4
+    assert win._btn_text_var.value == 'Start'
+
+
+def test_tick_reschedules_when_a_subsystem_raises():
+    win = _make_window()
+    scheduled = []
+    win._schedule = lambda delay_ms, callback: scheduled.append((delay_ms, callback))
+    
+    def fail(state):
+        raise RuntimeError("status query failed")
+    win._update_status = fail
+    
+    with pytest.raises(RuntimeError):
+        win._tick()  # tick 0 always refreshes status
+    
+    assert scheduled == [(MainWindow.TICK_MS, win._tick)]
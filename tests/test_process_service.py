@@ -0,0 +1,31 @@
+import os
+import threading
+
+from ui.services.process_service import OpenOBProcessManager
+
+
+def test_stream_output_splits_lines_across_reads():
+    read_fd, write_fd = os.pipe()
+    received = []
+    first_line = threading.Event()
+    
+    def callback(line):
+        received.append(line)
+        first_line.set()
+    
+    with os.fdopen(read_fd, 'rb') as stdout:
+        reader = threading.Thread(
+            target=OpenOBProcessManager._stream_output, args=(stdout, callback)
+        )
+        reader.start()
+        
+        # "two" is split between two reads; the reader has consumed the
+        # first write once "one" has been delivered
+        os.write(write_fd, b"one\r\ntw")
+        assert first_line.wait(5)
+        os.write(write_fd, b"o\r\nthree\nlast")
+        os.close(write_fd)
+        reader.join(5)
+    
+    assert not reader.is_alive()
+    assert received == ["one\n", "two\n", "three\n", "last"]
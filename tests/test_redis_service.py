@@ -0,0 +1,16 @@
+import pytest
+
+from ui.services.redis_service import RedisService
+
+
+@pytest.mark.parametrize("raw_host, expected", [
+    ("127.0.0.1", ("127.0.0.1", 6379)),
+    ("redis.local:6380", ("redis.local", 6380)),
+    ("[::1]:6380", ("::1", 6380)),
+    ("[::1]", ("::1", 6379)),
+    ("::1", ("::1", 6379)),
+    ("127.0.0.1:notaport", ("127.0.0.1", 6379)),
+    ("", (None, 6379)),
+])
+def test_parse_host_port(raw_host, expected):
+    assert RedisService.parse_host_port(raw_host) == expected
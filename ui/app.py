@@ -21,7 +21,7 @@ if str(REPO_ROOT) not in sys.path:
 
 from ui.core.models import AppConfig
 from ui.main_window import MainWindow
-from ui.services.utils import configure_logging, get_logger
+from ui.services.utils import configure_logging, get_logger, shutdown_logging
 
 
 def setup_environment() -> None:
@@ -101,6 +101,10 @@ def main() -> int:
     except Exception as e:
         logger.exception(f"Fatal error: {e}")
         return 1
+    
+    finally:
+        # Records are written by a listener thread: drain it before exit
+        shutdown_logging()
 
 
 if __name__ == '__main__':
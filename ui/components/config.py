@@ -136,6 +136,11 @@ class ConfigController:
         """Set callback for state changes."""
         self._on_state_change = callback
     
+    def set_state(self, state: ConfigState) -> None:
+        """Replace the whole configuration state (e.g. when a view is reused)."""
+        self._state = state
+        self._notify_change()
+    
     def set_transmission_mode(self, mode: TransmissionMode) -> None:
         """Change transmission mode."""
         self._state.transmission_mode = mode
@@ -220,7 +225,8 @@ class ConfigView(tk.Toplevel):
         parent: tk.Widget,
         controller: Optional[ConfigController] = None,
         on_close: Optional[Callable[[ConfigResult], None]] = None,
-        on_home: Optional[Callable[[], None]] = None
+        on_home: Optional[Callable[[], None]] = None,
+        hide_on_close: bool = False
     ):
         super().__init__(parent)
         
@@ -228,6 +234,11 @@ class ConfigView(tk.Toplevel):
         self._on_close_callback = on_close
         self._on_home_callback = on_home
         self._result: Optional[ConfigResult] = None
+        self._parent = parent
+        
+        # When set, closing only withdraws the window so it can be re-shown
+        # with show() instead of rebuilding every widget
+        self._hide_on_close = hide_on_close
         
         # Connect controller callbacks
         self._controller.set_on_state_change(self._on_state_changed)
@@ -245,6 +256,19 @@ class ConfigView(tk.Toplevel):
     def result(self) -> Optional[ConfigResult]:
         return self._result
     
+    def show(self, state: Optional[ConfigState] = None) -> None:
+        """
+        Re-show a withdrawn view, optionally loading a fresh state.
+        
+        Args:
+            state: Configuration to display (keeps the current one if None)
+        """
+        if state is not None:
+            self._controller.set_state(state)
+        self._result = None
+        self.deiconify()
+        self._center_on_parent(self._parent)
+    
     def _setup_window(self) -> None:
         """Configure window properties."""
         self.title("AudioBridge Pro")
@@ -528,7 +552,7 @@ class ConfigView(tk.Toplevel):
         self._result = self._controller.get_result()
         if self._on_close_callback:
             self._on_close_callback(self._result)
-        self.destroy()
+        self._close()
     
     def _on_home(self) -> None:
         """Handle home button click."""
@@ -537,7 +561,15 @@ class ConfigView(tk.Toplevel):
             self._on_home_callback()
         if self._on_close_callback:
             self._on_close_callback(self._result)
-        self.destroy()
+        self._close()
+    
+    def _close(self) -> None:
+        """Destroy the view, or just hide it when it is meant to be reused."""
+        if self._hide_on_close:
+            self.grab_release()
+            self.withdraw()
+        else:
+            self.destroy()
     
     def _on_logout(self) -> None:
         """Handle logout click (placeholder)."""
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import time
 import logging
+import threading
 from pathlib import Path
 from typing import Optional, Callable, List, Any, TYPE_CHECKING
 from dataclasses import dataclass
@@ -32,8 +33,7 @@ from ..services.process_service import (
 )
 from ..services.config_storage import ConfigStorageService, SavedConfig
 from ..services.utils import (
-    db_to_normalized, 
-    apply_vu_jitter, 
+    process_channels,
     smooth_value,
     get_refresh_rate_ms,
     simulate_vu_level,
@@ -86,7 +86,8 @@ class AppController:
         )
         self._requirements_checker = RequirementsChecker(
             gstreamer_bin=config.gstreamer_bin,
-            working_dir=config.repo_root
+            working_dir=config.repo_root,
+            redis_manager=self._redis_manager
         )
         
         # Setup logging
@@ -97,6 +98,9 @@ class AppController:
         # Use saved args if available, otherwise use default
         self._args_string: str = self._config_storage.config.get_current_args()
         
+        # Set on cleanup; background workers wait on it instead of sleeping
+        self.shutdown_event = threading.Event()
+        
         # VU loop state
         self._vu_loop_running = False
         self._vu_after_id: Optional[str] = None
@@ -134,8 +138,8 @@ class AppController:
         """Check system requirements and return status messages."""
         messages = self._requirements_checker.check_all()
         
-        # Update state
-        self.state.redis_running = self._requirements_checker.is_redis_running()
+        # Update state from the same Redis status snapshot check_all used
+        self.state.redis_running = self._requirements_checker.redis_status == ServiceStatus.RUNNING
         self.state.openob_running = self._openob_manager.is_running
         
         # Notify UI
@@ -362,15 +366,13 @@ class AppController:
                 self._set_vu_silence('remote', 'blocked', 'Cannot connect to Redis')
                 return
         
-        # Fetch and apply VU data
-        link = self._link_config.link_name
-        self._fetch_and_apply_vu(link, 'tx', 'local')
-        self._fetch_and_apply_vu(link, 'rx', 'remote')
+        # Fetch both roles in one round-trip and apply VU data
+        tx_data, rx_data = self._redis_service.fetch_vu_data_both(self._link_config.link_name)
+        self._apply_fetched_vu(tx_data, 'tx', 'local')
+        self._apply_fetched_vu(rx_data, 'rx', 'remote')
     
-    def _fetch_and_apply_vu(self, link: str, role: str, target: str) -> None:
-        """Fetch VU data for a specific role and apply to target."""
-        vu_data = self._redis_service.fetch_vu_data(link, role)
-        
+    def _apply_fetched_vu(self, vu_data: Optional[VUData], role: str, target: str) -> None:
+        """Apply fetched VU data for a specific role to target."""
         if vu_data is None:
             self._set_vu_silence(target, 'no-data', f'No data for {role}')
             return
@@ -385,22 +387,9 @@ class AppController:
     
     def _apply_vu_data(self, target: str, left_db: float, right_db: float) -> None:
         """Apply VU dB values to state with jitter and smoothing."""
-        left_norm = db_to_normalized(left_db)
-        right_norm = db_to_normalized(right_db)
-        
-        avg = (left_norm + right_norm) / 2
-        left_norm, right_norm, smooth = apply_vu_jitter(left_norm, right_norm, avg)
-        
-        if target == 'local':
-            vu = self.state.local_vu
-            vu.left = smooth_value(vu.left, left_norm, smooth)
-            vu.right = smooth_value(vu.right, right_norm, smooth)
-            vu.has_real_data = True
-        else:
-            vu = self.state.remote_vu
-            vu.left = smooth_value(vu.left, left_norm, smooth)
-            vu.right = smooth_value(vu.right, right_norm, smooth)
-            vu.has_real_data = True
+        vu = self.state.local_vu if target == 'local' else self.state.remote_vu
+        vu.left, vu.right, _ = process_channels(left_db, right_db, vu.left, vu.right)
+        vu.has_real_data = True
     
     def _set_vu_silence(self, target: str, status: str, detail: str) -> None:
         """Set VU to silence mode (let animation handle decay)."""
@@ -434,18 +423,20 @@ class AppController:
         Returns:
             Next frame delay in milliseconds
         """
+        now = time.time()  # one clock read for every simulated level this frame
+        
         # Local VU (Audio Input)
         if not self.state.local_vu.has_real_data:
             if self.state.openob_running:
                 # Simulate VU
                 self.state.local_vu.left = smooth_value(
                     self.state.local_vu.left,
-                    simulate_vu_level(0.0),
+                    simulate_vu_level(0.0, now=now),
                     0.75
                 )
                 self.state.local_vu.right = smooth_value(
                     self.state.local_vu.right,
-                    simulate_vu_level(0.5),
+                    simulate_vu_level(0.5, now=now),
                     0.75
                 )
             else:
@@ -454,7 +445,7 @@ class AppController:
         # Remote VU (Receiver)
         if not self.state.remote_vu.has_real_data:
             if self.state.openob_running:
-                level = simulate_vu_level(1.0, 0.8)
+                level = simulate_vu_level(1.0, 0.8, now)
                 self.state.receiver_level = smooth_value(
                     self.state.receiver_level,
                     level,
@@ -518,10 +509,12 @@ class AppController:
     
     def cleanup(self) -> None:
         """Clean shutdown of controller."""
+        self.shutdown_event.set()
         self.stop_vu_loop()
         if self._openob_manager.is_running:
             self._openob_manager.stop()
         self._redis_service.disconnect()
+        self._redis_manager.close()
     
     def shutdown(self) -> None:
         """Alias for cleanup - clean shutdown of controller."""
@@ -16,10 +16,15 @@ Design decisions:
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-from PIL import Image, ImageTk
+from PIL import Image, ImageDraw, ImageTk
 from typing import Optional
+from collections import deque
+from bisect import bisect_right
+import dataclasses
 import math
-import random
+import queue
+import re
+import threading
 import time
 
 from .core.models import AppConfig, AppState, LinkConfig
@@ -28,6 +33,16 @@ from .services.utils import get_logger
 
 logger = get_logger(__name__)
 
+# Log widget highlight: first keyword found (in priority order) -> tag
+_LOG_TAG_MAP = {
+    'ERROR': 'ERROR',
+    'WARN': 'WARN',
+    'INFO': 'INFO',
+    'OBBROADCAST': 'OBBROADCAST',
+}
+_LOG_TAG_RE = re.compile('|'.join(_LOG_TAG_MAP), re.IGNORECASE)
+_LOG_TAG_PRIORITY = {keyword: i for i, keyword in enumerate(_LOG_TAG_MAP)}
+
 
 class MainWindow:
     """
@@ -35,10 +50,45 @@ class MainWindow:
     Matches the original main.py design exactly.
     """
     
+    # One scheduler tick drives Redis polling, status, cooldown and logs;
+    # the *_EVERY values are in ticks
+    TICK_MS = 100
+    STATUS_EVERY = 20       # 2 s
+    COOLDOWN_EVERY = 10     # 1 s
+    VU_IDLE_EVERY = 10      # Redis poll while OpenOB is stopped: 1 s
+    
+    # Log lines are queued by any thread and pumped into the widget each tick
+    LOG_QUEUE_MAX = 2000
+    LOG_MAX_LINES = 5000    # older lines are pruned from the widget
+    # Log widget tag -> Text tag options, applied once when the panel is built
+    _LOG_TAGS = {
+        'ERROR': {'foreground': '#ef5350'},
+        'WARN': {'foreground': '#ffb74d'},
+        'INFO': {'foreground': '#4fc3f7'},
+        'OBBROADCAST': {'foreground': '#81c784'},
+    }
+    
+    # VU ring thresholds (ascending) and the color of each ring when lit
+    VU_THRESHOLDS = (0.05, 0.15, 0.25, 0.35, 0.45, 0.55, 0.65, 0.78, 0.90)
+    VU_RING_COLORS = (
+        "#3fbf5f", "#3fbf5f", "#3fbf5f",  # green
+        "#5fcf5f", "#7fdf5f", "#bfef3f",  # yellow-green
+        "#f2c94c", "#f0a030", "#e04b4b",  # yellow to red
+    )
+    VU_INACTIVE_COLOR = "#cfcfcf"
+    
+    # Requirements are probed off the UI thread at this interval
+    REQ_CHECK_INTERVAL_S = 10
+    
     def __init__(self, root: tk.Tk, config: AppConfig):
         self.root = root
         self.config = config
         
+        # Window geometry is fixed (not resizable): resolve it once
+        self._cx = config.center_x
+        self._width = config.width
+        self._height = config.height
+        
         # Initialize controller
         self.controller = AppController(config)
         self.controller.set_root(root)
@@ -52,14 +102,37 @@ class MainWindow:
         self.vu_right = 0.0
         self.receiver_level = 0.0
         self._has_real_vu_data = {'local': False, 'remote': False}
+        self._last_levels = None
+        self._last_status_key = None
+        self._last_btn_key = None
+        self._last_link_info = None
+        self._frame_times = deque(maxlen=20)  # seconds spent per VU frame
+        self._tick_count = 0
+        self._after_ids = set()  # pending root.after ids, cancelled on close
+        self._cooldown_due: Optional[int] = None  # tick of the next cooldown step
+        
+        # xorshift64 state for simulated VU jitter (must be non-zero)
+        self._prng = ((id(self) ^ int(time.time() * 1000)) & 0xFFFFFFFFFFFFFFFF) or 0x9E3779B97F4A7C15
         
         # Visual parameters
         self.outer_radius = 130
         self.red_center_radius = 95
         
-        # Logs visibility
+        # Logs visibility (panel is built on first toggle)
         self._logs_visible = False
+        self.log_frame: Optional[tk.Frame] = None
+        self.log_widget: Optional[scrolledtext.ScrolledText] = None
+        self._log_q = queue.SimpleQueue()  # (tag, text) from any thread -> UI thread
+        self._log_queue = deque(maxlen=self.LOG_QUEUE_MAX)  # (tag, text), oldest dropped
         self._auto_started = False
+        self._config_view = None  # ConfigView, built on first settings click
+        self._settings_state_cache = None  # (args, ConfigState) of the last click
+        
+        # Requirements text (written by the checker thread, read by the UI)
+        self._req_text: Optional[str] = None
+        self._last_req_text: Optional[str] = None
+        self._req_lock = threading.Lock()
+        self._req_thread: Optional[threading.Thread] = None
         
         # Window configuration
         self._setup_window()
@@ -72,7 +145,6 @@ class MainWindow:
         self._draw_receiver_bar()
         self._draw_status_cards()
         self._draw_control_buttons()
-        self._create_logs_panel()
         self._load_center_icon()
         
         # Bind events
@@ -86,7 +158,7 @@ class MainWindow:
     def _setup_window(self) -> None:
         """Configure main window properties."""
         self.root.title('OBBroadcast Controller')
-        self.root.geometry(f'{self.config.width}x{self.config.height}')
+        self.root.geometry(f'{self._width}x{self._height}')
         self.root.configure(bg='#ffffff')
         self.root.resizable(False, False)
         
@@ -128,8 +200,8 @@ class MainWindow:
         """Create main canvas with white background."""
         self.canvas = tk.Canvas(
             self.root,
-            width=self.config.width,
-            height=self.config.height,
+            width=self._width,
+            height=self._height,
             bg='#ffffff',
             highlightthickness=0
         )
@@ -137,7 +209,7 @@ class MainWindow:
     
     def _draw_header(self) -> None:
         """Draw the header with title and dynamic status."""
-        cx = self.config.center_x
+        cx = self._cx
         
         # Main title (changes based on mode: TX/RX)
         self._title_text_id = self.canvas.create_text(
@@ -154,12 +226,12 @@ class MainWindow:
             text="Stopped",
             font=("Segoe UI", 48, "bold"),
             fill="#c62828",
-            tags='header'
+            tags=('header', 'status')
         )
     
     def _draw_vu_circle(self) -> None:
         """Draw the single central circular VU meter."""
-        cx = self.config.center_x
+        cx = self._cx
         center_y = 290
         
         # Gray outer ring (background)
@@ -190,10 +262,12 @@ class MainWindow:
         
         # VU arc segments
         self.segment_ids = []
-        rings = 9
+        seg_left = []
+        seg_right = []
+        rings = len(self.VU_THRESHOLDS)
         ring_spacing = 10
         base_outer = r_red + 8
-        inactive_color = "#cfcfcf"
+        inactive_color = self.VU_INACTIVE_COLOR
         arc_extent = 50
         
         for ring in range(rings):
@@ -209,6 +283,7 @@ class MainWindow:
                 tags='vu_arc'
             )
             self.segment_ids.append({'id': cid_l, 'side': 'left', 'ring': ring})
+            seg_left.append(cid_l)
             
             # Right arc
             right_start = (360 - arc_extent / 2) % 360
@@ -219,13 +294,20 @@ class MainWindow:
                 tags='vu_arc'
             )
             self.segment_ids.append({'id': cid_r, 'side': 'right', 'ring': ring})
+            seg_right.append(cid_r)
+        
+        # Arc ids per side, indexed by ring, and how many rings are lit
+        self._seg_ids_left = tuple(seg_left)
+        self._seg_ids_right = tuple(seg_right)
+        self._lit_left = 0
+        self._lit_right = 0
         
         # Store center position for icon
         self._vu_center_y = center_y
     
     def _draw_receiver_bar(self) -> None:
         """Draw the horizontal receiver audio bar."""
-        cx = self.config.center_x
+        cx = self._cx
         center_y = 290
         bar_y = center_y + self.outer_radius + 50
         bar_w = 500
@@ -239,6 +321,8 @@ class MainWindow:
         self._bar_h = bar_h
         self._bar_x1 = bx1
         self._bar_x2 = bx2
+        self._bar_half_len = (bx2 - bx1) // 2
+        self._cap_pad = bar_h // 2
         
         # Label (changes based on mode)
         self._bar_label_id = self.canvas.create_text(
@@ -250,56 +334,78 @@ class MainWindow:
             tags='label'
         )
         
-        # Background bar
-        self.canvas.create_rectangle(
-            bx1, bar_y, bx2, bar_y + bar_h,
-            fill="#dbe0e3", outline="#c9cfd3", width=1,
-            tags='bar_bg'
+        # Static parts (background, center line, ticks, extremes) are
+        # pre-rendered into one image so the canvas keeps a single item
+        # instead of twelve for expose redraws.
+        pad_x, pad_y = 20, 10
+        self._bar_static_img = ImageTk.PhotoImage(
+            self._render_bar_static(bar_w, bar_h, pad_x, pad_y)
         )
-        
-        # Center line
-        self.canvas.create_line(
-            cx, bar_y - 6, cx, bar_y + bar_h + 6,
-            fill="#b9b9b9", tags='bar_center'
+        self.canvas.create_image(
+            bx1 - pad_x, bar_y - pad_y,
+            image=self._bar_static_img,
+            anchor='nw',
+            tags='bar_bg'
         )
         
-        # Tick marks
-        ticks = 8
-        for i in range(ticks + 1):
-            tx = bx1 + bar_w * (i / ticks)
-            self.canvas.create_line(
-                tx, bar_y - 4, tx, bar_y + bar_h + 4,
-                fill="#e0e0e0", tags='bar_tick'
-            )
-        
-        # Extremes
-        self.canvas.create_line(bx1, bar_y - 6, bx1, bar_y + bar_h + 6, fill="#b9b9b9")
-        self.canvas.create_line(bx2, bar_y - 6, bx2, bar_y + bar_h + 6, fill="#b9b9b9")
-        
         # Dynamic bars
         self.receiver_bar_left = self.canvas.create_rectangle(
             cx, bar_y, cx, bar_y + bar_h,
-            fill="#3fbf5f", outline="", tags='bar_level'
+            fill="#3fbf5f", outline="", tags=('bar_level', 'bar_dynamic')
         )
         self.receiver_bar_right = self.canvas.create_rectangle(
             cx, bar_y, cx, bar_y + bar_h,
-            fill="#3fbf5f", outline="", tags='bar_level'
+            fill="#3fbf5f", outline="", tags=('bar_level', 'bar_dynamic')
         )
         
         # Rounded caps
         cap_pad = bar_h // 2
         self.receiver_cap_left = self.canvas.create_oval(
             cx - cap_pad, bar_y, cx + cap_pad, bar_y + bar_h,
-            fill="#3fbf5f", outline="", tags='bar_cap'
+            fill="#3fbf5f", outline="", tags=('bar_cap', 'bar_dynamic')
         )
         self.receiver_cap_right = self.canvas.create_oval(
             cx - cap_pad, bar_y, cx + cap_pad, bar_y + bar_h,
-            fill="#3fbf5f", outline="", tags='bar_cap'
+            fill="#3fbf5f", outline="", tags=('bar_cap', 'bar_dynamic')
         )
+        self._bar_color = "#3fbf5f"  # last fill applied to 'bar_dynamic'
+        
+        # Caps start hidden (level is zero until audio arrives)
+        self.canvas.itemconfigure('bar_cap', state='hidden')
+        self._caps_hidden = True
+    
+    @staticmethod
+    def _render_bar_static(bar_w: int, bar_h: int, pad_x: int, pad_y: int) -> Image.Image:
+        """Render the receiver bar background, ticks and extremes."""
+        img = Image.new('RGBA', (bar_w + 2 * pad_x, bar_h + 2 * pad_y), (255, 255, 255, 0))
+        draw = ImageDraw.Draw(img)
+        
+        # Coordinates relative to the image (bar starts at pad_x, pad_y)
+        x1, x2 = pad_x, pad_x + bar_w
+        y1, y2 = pad_y, pad_y + bar_h
+        mid = pad_x + bar_w // 2
+        
+        # Background bar
+        draw.rectangle((x1, y1, x2, y2), fill="#dbe0e3", outline="#c9cfd3", width=1)
+        
+        # Center line
+        draw.line((mid, y1 - 6, mid, y2 + 6), fill="#b9b9b9")
+        
+        # Tick marks
+        ticks = 8
+        for i in range(ticks + 1):
+            tx = round(x1 + bar_w * (i / ticks))
+            draw.line((tx, y1 - 4, tx, y2 + 4), fill="#e0e0e0")
+        
+        # Extremes
+        draw.line((x1, y1 - 6, x1, y2 + 6), fill="#b9b9b9")
+        draw.line((x2, y1 - 6, x2, y2 + 6), fill="#b9b9b9")
+        
+        return img
     
     def _draw_status_cards(self) -> None:
         """Draw link info text."""
-        cx = self.config.center_x
+        cx = self._cx
         card_y = 520
         
         self._link_info_id = self.canvas.create_text(
@@ -313,13 +419,14 @@ class MainWindow:
     
     def _draw_control_buttons(self) -> None:
         """Draw control buttons."""
-        cx = self.config.center_x
+        cx = self._cx
         btn_y = 580
         
-        # Main action button (Start/Stop toggle)
+        # Main action button (Start/Stop toggle); label bound to a StringVar
+        self._btn_text_var = tk.StringVar(value="Start")
         self.main_action_btn = ttk.Button(
             self.root,
-            text="Start",
+            textvariable=self._btn_text_var,
             command=self._on_toggle_click,
             style='Start.TButton'
         )
@@ -334,7 +441,7 @@ class MainWindow:
             variable=self.auto_start_var,
             command=self._on_auto_start_changed
         )
-        self.canvas.create_window(140, self.config.height - 40, window=self.auto_chk, anchor='w')
+        self.canvas.create_window(140, self._height - 40, window=self.auto_chk, anchor='w')
         
         # Settings button (bottom right)
         self.settings_btn = ttk.Button(
@@ -344,8 +451,8 @@ class MainWindow:
             style='Settings.TButton'
         )
         self.canvas.create_window(
-            self.config.width - 140,
-            self.config.height - 40,
+            self._width - 140,
+            self._height - 40,
             window=self.settings_btn,
             anchor='e',
             width=120,
@@ -360,8 +467,8 @@ class MainWindow:
             style='Settings.TButton'
         )
         self.canvas.create_window(
-            self.config.width - 270,
-            self.config.height - 40,
+            self._width - 270,
+            self._height - 40,
             window=self.logs_btn,
             anchor='e',
             width=100,
@@ -369,11 +476,12 @@ class MainWindow:
         )
         
         # Requirements status label (bottom center)
-        self.req_label = ttk.Label(self.root, text='Checking requirements...', font=('Segoe UI', 8))
-        self.canvas.create_window(cx, self.config.height - 20, window=self.req_label)
+        self._req_text_var = tk.StringVar(value='Checking requirements...')
+        self.req_label = ttk.Label(self.root, textvariable=self._req_text_var, font=('Segoe UI', 8))
+        self.canvas.create_window(cx, self._height - 20, window=self.req_label)
     
     def _create_logs_panel(self) -> None:
-        """Create the logs panel (hidden by default)."""
+        """Create the logs panel (deferred until first shown)."""
         self.log_frame = tk.Frame(self.root, bg='#f0f0f0', bd=2, relief='groove')
         
         log_header = tk.Frame(self.log_frame, bg='#e0e0e0')
@@ -388,12 +496,13 @@ class MainWindow:
             insertbackground='white'
         )
         self.log_widget.pack(fill='both', expand=True, padx=4, pady=4)
-        
-        self.log_widget.tag_configure('INFO', foreground='#4fc3f7')
-        self.log_widget.tag_configure('WARN', foreground='#ffb74d')
-        self.log_widget.tag_configure('WARNING', foreground='#ffb74d')
-        self.log_widget.tag_configure('ERROR', foreground='#ef5350')
-        self.log_widget.tag_configure('OBBROADCAST', foreground='#81c784')
+        self._configure_log_tags()
+    
+    def _configure_log_tags(self) -> None:
+        """Register the highlight tags used by _flush_logs on the log widget."""
+        tag_configure = self.log_widget.tag_configure
+        for name, opts in self._LOG_TAGS.items():
+            tag_configure(name, **opts)
     
     def _load_center_icon(self) -> None:
         """Load the input_line.png icon for the center of the VU circle."""
@@ -402,15 +511,21 @@ class MainWindow:
         
         if icon_path.exists():
             try:
-                img = Image.open(str(icon_path)).convert("RGBA")
                 icon_size = 130
-                img = img.resize((icon_size, icon_size), Image.LANCZOS)
-                self.center_icon_img = ImageTk.PhotoImage(img)
+                with Image.open(str(icon_path)) as src:
+                    # draft() lets JPEG-style decoders scale down while
+                    # decoding; it is a no-op for PNG
+                    src.draft('RGBA', (icon_size, icon_size))
+                    img = src if src.mode == 'RGBA' else src.convert("RGBA")
+                    if img.size != (icon_size, icon_size):
+                        img = img.resize((icon_size, icon_size), Image.LANCZOS)
+                    # One PhotoImage, kept alive on self for the canvas item
+                    self.center_icon_img = ImageTk.PhotoImage(img)
             except Exception as e:
                 logger.warning(f"Error loading center icon: {e}")
         
         if self.center_icon_img:
-            cx = self.config.center_x
+            cx = self._cx
             self.canvas.create_image(
                 cx, self._vu_center_y,
                 image=self.center_icon_img,
@@ -427,17 +542,50 @@ class MainWindow:
         # VU animation (fast)
         self._animate_vu()
         
-        # VU data from Redis (100ms)
-        self._update_vu_from_redis()
+        # Requirements check (background thread, 10s)
+        self._req_thread = threading.Thread(target=self._requirements_worker, daemon=True)
+        self._req_thread.start()
         
-        # Status update (2000ms)
-        self._update_status_loop()
+        # Redis VU, status, cooldown and logs (100ms tick)
+        self._tick()
         
         # Auto-start check (1500ms delay)
-        self.root.after(1500, self._auto_start_if_enabled)
+        self._schedule(1500, self._auto_start_if_enabled)
+    
+    def _schedule(self, delay_ms: int, callback) -> str:
+        """root.after() that remembers the id until it fires, for cleanup."""
+        def run():
+            self._after_ids.discard(after_id)
+            callback()
+        after_id = self.root.after(delay_ms, run)
+        self._after_ids.add(after_id)
+        return after_id
+    
+    def _tick(self) -> None:
+        """Single periodic scheduler for everything except the VU render loop."""
+        # Re-arm first so an exception in one subsystem doesn't end the loop
+        self._schedule(self.TICK_MS, self._tick)
+        
+        n = self._tick_count
+        self._tick_count = n + 1
+        state = self.controller.state  # one snapshot shared by every subsystem
+        
+        # Nothing new can arrive in Redis while OpenOB is stopped: poll slowly
+        if (state.openob_running or n % self.VU_IDLE_EVERY == 0
+                or any(self._has_real_vu_data.values())):
+            self._update_vu_from_redis(state)
+        
+        if self._cooldown_due is not None and n >= self._cooldown_due:
+            self._cooldown_tick(state, n)
+        
+        if n % self.STATUS_EVERY == 0:
+            self._update_status(state)
+        
+        self._pump_logs()
     
     def _animate_vu(self) -> None:
         """Animate VU meters with smooth transitions."""
+        frame_start = time.perf_counter()
         openob_running = self.controller.is_openob_running()
         
         # Determine current mode
@@ -451,8 +599,10 @@ class MainWindow:
             pass  # Real data updated by _update_vu_from_redis
         elif openob_running and not is_rx_mode:
             # TX mode only: Simulate when no Redis data
-            target_left = abs(math.sin(time.time() * 2.5 + random.random() * 0.5)) * 0.85 + random.random() * 0.15
-            target_right = abs(math.cos(time.time() * 2.3 + random.random() * 0.5)) * 0.85 + random.random() * 0.15
+            now = time.time()
+            fast_rand = self._fast_rand
+            target_left = abs(math.sin(now * 2.5 + fast_rand() * 0.5)) * 0.85 + fast_rand() * 0.15
+            target_right = abs(math.cos(now * 2.3 + fast_rand() * 0.5)) * 0.85 + fast_rand() * 0.15
             self.vu_left = 0.75 * self.vu_left + 0.25 * target_left
             self.vu_right = 0.75 * self.vu_right + 0.25 * target_right
         else:
@@ -473,12 +623,15 @@ class MainWindow:
             if self.receiver_level < 0.01:
                 self.receiver_level = 0
         
-        # Update visuals
-        self._update_vu_arcs()
-        self._update_receiver_bar_visual()
+        # Update visuals (skipped when no level moved since the last frame)
+        levels = (self.vu_left, self.vu_right, self.receiver_level)
+        if levels != self._last_levels:
+            self._last_levels = levels
+            self._update_vu_arcs()
+            self._update_receiver_bar_visual()
         
         # Schedule next frame
-        avg_level = max(self.vu_left, self.vu_right, self.receiver_level)
+        avg_level = max(levels)
         if avg_level > 0.7:
             refresh_ms = 40
         elif avg_level > 0.4:
@@ -486,58 +639,84 @@ class MainWindow:
         else:
             refresh_ms = 80
         
-        self.root.after(refresh_ms, self._animate_vu)
+        # Subtract the average time spent in recent frames so the real
+        # frame period tracks refresh_ms instead of refresh_ms + work
+        frame_times = self._frame_times
+        frame_times.append(time.perf_counter() - frame_start)
+        work_ms = sum(frame_times) * 1000.0 / len(frame_times)
+        
+        self._schedule(max(1, int(refresh_ms - work_ms)), self._animate_vu)
+    
+    def _fast_rand(self) -> float:
+        """Return a value in [0, 1] from a xorshift64 generator (visual noise only)."""
+        x = self._prng
+        x ^= (x << 13) & 0xFFFFFFFFFFFFFFFF
+        x ^= x >> 7
+        x ^= (x << 17) & 0xFFFFFFFFFFFFFFFF
+        self._prng = x
+        return (x & 0xFFFF) / 65535.0
     
     def _update_vu_arcs(self) -> None:
         """Update the arc segments based on current VU levels."""
-        thresholds = [0.05, 0.15, 0.25, 0.35, 0.45, 0.55, 0.65, 0.78, 0.90]
-        inactive_color = "#cfcfcf"
-        ring_colors = [
-            "#3fbf5f", "#3fbf5f", "#3fbf5f",  # green
-            "#5fcf5f", "#7fdf5f", "#bfef3f",  # yellow-green
-            "#f2c94c", "#f0a030", "#e04b4b",  # yellow to red
-        ]
-        
-        for seg in self.segment_ids:
-            ring = seg['ring']
-            side = seg['side']
-            cid = seg['id']
-            thr = thresholds[ring]
-            
-            level = self.vu_left if side == 'left' else self.vu_right
-            
-            if level >= thr:
-                col = ring_colors[ring]
-            else:
-                col = inactive_color
-            
-            self.canvas.itemconfigure(cid, outline=col)
+        # Thresholds are sorted, so the rings lit for a level are exactly the
+        # first bisect_right(thresholds, level) ones (level >= thr).
+        lit_left = bisect_right(self.VU_THRESHOLDS, self.vu_left)
+        lit_right = bisect_right(self.VU_THRESHOLDS, self.vu_right)
+        
+        if lit_left != self._lit_left:
+            self._recolor_rings(self._seg_ids_left, self._lit_left, lit_left)
+            self._lit_left = lit_left
+        if lit_right != self._lit_right:
+            self._recolor_rings(self._seg_ids_right, self._lit_right, lit_right)
+            self._lit_right = lit_right
+    
+    def _recolor_rings(self, seg_ids: tuple, old_lit: int, new_lit: int) -> None:
+        """Recolor only the rings between the previous and new lit count."""
+        # Talk to Tcl directly: Canvas.itemconfigure() re-parses options in
+        # Python on every call.
+        tk_call = self.canvas.tk.call
+        w = self.canvas._w
+        
+        if new_lit > old_lit:
+            ring_colors = self.VU_RING_COLORS
+            for ring in range(old_lit, new_lit):
+                tk_call(w, 'itemconfigure', seg_ids[ring], '-outline', ring_colors[ring])
+        else:
+            inactive_color = self.VU_INACTIVE_COLOR
+            for ring in range(new_lit, old_lit):
+                tk_call(w, 'itemconfigure', seg_ids[ring], '-outline', inactive_color)
     
     def _update_receiver_bar_visual(self) -> None:
         """Update the receiver bar based on current level."""
-        cx = self.config.center_x
+        coords = self.canvas.coords
+        cx = self._cx
         bar_y = self._bar_y
-        bar_h = self._bar_h
+        bar_y2 = bar_y + self._bar_h
         bx1 = self._bar_x1
         bx2 = self._bar_x2
-        half_len = (bx2 - bx1) // 2
+        half_len = self._bar_half_len
         
         cur = int(max(0, min(1.0, self.receiver_level)) * half_len) if self.receiver_level > 0 else 0
         
         # Update bar positions
-        self.canvas.coords(self.receiver_bar_left, cx - cur, bar_y, cx, bar_y + bar_h)
-        self.canvas.coords(self.receiver_bar_right, cx, bar_y, cx + cur, bar_y + bar_h)
+        coords(self.receiver_bar_left, cx - cur, bar_y, cx, bar_y2)
+        coords(self.receiver_bar_right, cx, bar_y, cx + cur, bar_y2)
         
         # Update caps
-        cap_pad = bar_h // 2
+        cap_pad = self._cap_pad
         if cur <= 0:
-            self.canvas.coords(self.receiver_cap_left, -10, -10, -5, -5)
-            self.canvas.coords(self.receiver_cap_right, -10, -10, -5, -5)
+            # Hidden items are skipped by the canvas display list entirely
+            if not self._caps_hidden:
+                self._caps_hidden = True
+                self.canvas.itemconfigure('bar_cap', state='hidden')
         else:
+            if self._caps_hidden:
+                self._caps_hidden = False
+                self.canvas.itemconfigure('bar_cap', state='normal')
             left_cap_x = max(cx - cur, bx1 + cap_pad)
             right_cap_x = min(cx + cur, bx2 - cap_pad)
-            self.canvas.coords(self.receiver_cap_left, left_cap_x - cap_pad, bar_y, left_cap_x + cap_pad, bar_y + bar_h)
-            self.canvas.coords(self.receiver_cap_right, right_cap_x - cap_pad, bar_y, right_cap_x + cap_pad, bar_y + bar_h)
+            coords(self.receiver_cap_left, left_cap_x - cap_pad, bar_y, left_cap_x + cap_pad, bar_y2)
+            coords(self.receiver_cap_right, right_cap_x - cap_pad, bar_y, right_cap_x + cap_pad, bar_y2)
         
         # Color based on level
         level_norm = cur / float(half_len) if half_len else 0
@@ -548,19 +727,20 @@ class MainWindow:
         else:
             color = "#3fbf5f"
         
-        self.canvas.itemconfigure(self.receiver_bar_left, fill=color)
-        self.canvas.itemconfigure(self.receiver_bar_right, fill=color)
-        self.canvas.itemconfigure(self.receiver_cap_left, fill=color)
-        self.canvas.itemconfigure(self.receiver_cap_right, fill=color)
+        # Bars and caps share the 'bar_dynamic' tag: one call recolors all four
+        if color != self._bar_color:
+            self._bar_color = color
+            self.canvas.itemconfigure('bar_dynamic', fill=color)
     
-    def _update_vu_from_redis(self) -> None:
-        """Fetch VU data from Redis via controller."""
+    def _update_vu_from_redis(self, state: AppState) -> None:
+        """Fetch VU data from Redis via controller into the tick's state."""
         try:
             # First trigger controller to fetch from Redis
             self.controller.update_vu_from_redis()
             
-            # Then get the updated state
-            state = self.controller.state
+            # The fetch updates state in place; bind both VU snapshots once
+            local_vu = state.local_vu
+            remote_vu = state.remote_vu
             
             # Determine current mode
             link_config = self.controller.get_link_config()
@@ -575,92 +755,62 @@ class MainWindow:
             
             if is_rx_mode:
                 # RX Mode: Circular VU shows received audio (remote_vu from rx)
-                if state.remote_vu.has_real_data:
-                    avg_remote = state.remote_vu.average
+                if remote_vu.has_real_data:
+                    avg_remote = remote_vu.average
                     if avg_remote >= 0.02:
                         self._has_real_vu_data['local'] = True
-                        self.vu_left = state.remote_vu.left
-                        self.vu_right = state.remote_vu.right
+                        self.vu_left = remote_vu.left
+                        self.vu_right = remote_vu.right
                     else:
                         self._has_real_vu_data['local'] = False
                 else:
                     self._has_real_vu_data['local'] = False
                 
                 # Bar shows transmitted audio (local_vu from tx)
-                if state.local_vu.has_real_data:
+                if local_vu.has_real_data:
                     self._has_real_vu_data['remote'] = True
-                    avg_local = state.local_vu.average
+                    avg_local = local_vu.average
                     self.receiver_level = 0.7 * self.receiver_level + 0.3 * avg_local
                 else:
                     self._has_real_vu_data['remote'] = False
             else:
                 # TX Mode: Normal behavior
                 # Circular VU shows audio being transmitted (local_vu)
-                if state.local_vu.has_real_data:
-                    avg_local = state.local_vu.average
+                if local_vu.has_real_data:
+                    avg_local = local_vu.average
                     if avg_local >= 0.02:
                         self._has_real_vu_data['local'] = True
-                        self.vu_left = state.local_vu.left
-                        self.vu_right = state.local_vu.right
+                        self.vu_left = local_vu.left
+                        self.vu_right = local_vu.right
                     else:
                         self._has_real_vu_data['local'] = False
                 else:
                     self._has_real_vu_data['local'] = False
                 
                 # Bar shows what receiver is getting (remote_vu from rx)
-                if state.remote_vu.has_real_data:
+                if remote_vu.has_real_data:
                     self._has_real_vu_data['remote'] = True
-                    avg_remote = state.remote_vu.average
+                    avg_remote = remote_vu.average
                     self.receiver_level = 0.7 * self.receiver_level + 0.3 * avg_remote
                 else:
                     self._has_real_vu_data['remote'] = False
             
         except Exception:
             pass
-        
-        self.root.after(100, self._update_vu_from_redis)
     
-    def _update_status_loop(self) -> None:
-        """Update status display."""
+    def _update_status(self, state: AppState) -> None:
+        """Update status display (state is refreshed in place)."""
         self.controller.refresh_status()
-        state = self.controller.state
+        itemconfig = self.canvas.itemconfigure
         
         # Determine current mode (TX or RX)
         link_config = self.controller.get_link_config()
         is_rx_mode = link_config and link_config.link_mode == 'rx'
         
-        # Update labels based on mode
-        if is_rx_mode:
-            self.canvas.itemconfigure(self._title_text_id, text="OBBroadcast RX")
-            self.canvas.itemconfigure(self._vu_label_id, text="Audio Output")
-            self.canvas.itemconfigure(self._bar_label_id, text="Audio Transmitted")
-        else:
-            self.canvas.itemconfigure(self._title_text_id, text="OBBroadcast TX")
-            self.canvas.itemconfigure(self._vu_label_id, text="Audio Input")
-            self.canvas.itemconfigure(self._bar_label_id, text="Receiver Audio")
-        
-        # Update header status text based on mode and running state
-        if state.openob_running:
-            if is_rx_mode:
-                self.canvas.itemconfigure(self._status_text_id, text="Receiving", fill="#2e7d32")
-            else:
-                self.canvas.itemconfigure(self._status_text_id, text="Transmitting", fill="#2e7d32")
-        else:
-            self.canvas.itemconfigure(self._status_text_id, text="Stopped", fill="#c62828")
-        
-        # Update button
-        if state.cooldown_active:
-            self.main_action_btn.configure(
-                state='disabled',
-                text=f'Espera {state.cooldown_remaining}s'
-            )
-        elif state.openob_running:
-            self.main_action_btn.configure(text="Stop", style='Stop.TButton', state='normal')
-        else:
-            self.main_action_btn.configure(text="Start", style='Start.TButton', state='normal')
+        self._update_status_text(state, is_rx_mode)
+        self._update_toggle_button(state)
         
         # Update link info
-        link_config = self.controller.get_link_config()
         if link_config:
             info_parts = []
             if link_config.config_host:
@@ -670,17 +820,76 @@ class MainWindow:
             if link_config.link_name:
                 info_parts.append(f"Link: {link_config.link_name}")
             link_info = " | ".join(info_parts)
-            self.canvas.itemconfigure(self._link_info_id, text=link_info)
+            if link_info != self._last_link_info:
+                self._last_link_info = link_info
+                itemconfig(self._link_info_id, text=link_info)
         
         # Update requirements
         self._update_requirements_label()
+    
+    def _update_status_text(self, state: AppState, is_rx_mode: bool) -> None:
+        """Update mode labels and header status; no Tk calls if unchanged."""
+        key = (bool(is_rx_mode), state.openob_running)
+        if key == self._last_status_key:
+            return
+        self._last_status_key = key
+        itemconfig = self.canvas.itemconfigure
+        
+        # Update labels based on mode
+        if is_rx_mode:
+            itemconfig(self._title_text_id, text="OBBroadcast RX")
+            itemconfig(self._vu_label_id, text="Audio Output")
+            itemconfig(self._bar_label_id, text="Audio Transmitted")
+        else:
+            itemconfig(self._title_text_id, text="OBBroadcast TX")
+            itemconfig(self._vu_label_id, text="Audio Input")
+            itemconfig(self._bar_label_id, text="Receiver Audio")
         
-        self.root.after(2000, self._update_status_loop)
+        # Update header status text based on mode and running state
+        if state.openob_running:
+            text, color = ("Receiving" if is_rx_mode else "Transmitting"), "#2e7d32"
+        else:
+            text, color = "Stopped", "#c62828"
+        itemconfig('status', text=text, fill=color)
+    
+    def _update_toggle_button(self, state: AppState) -> None:
+        """Update the Start/Stop button; no Tk calls if unchanged."""
+        key = (state.openob_running, state.cooldown_active, state.cooldown_remaining)
+        if key == self._last_btn_key:
+            return
+        self._last_btn_key = key
+        
+        if state.cooldown_active:
+            self.main_action_btn.configure(state='disabled')
+            self._btn_text_var.set(f'Espera {state.cooldown_remaining}s')
+        elif state.openob_running:
+            self.main_action_btn.configure(style='Stop.TButton', state='normal')
+            self._btn_text_var.set("Stop")
+        else:
+            self.main_action_btn.configure(style='Start.TButton', state='normal')
+            self._btn_text_var.set("Start")
+    
+    def _requirements_worker(self) -> None:
+        """Probe requirements periodically without blocking the UI thread."""
+        shutdown = self.controller.shutdown_event
+        while not shutdown.is_set():
+            try:
+                msgs = self.controller.check_requirements()
+                with self._req_lock:
+                    self._req_text = ' | '.join(msgs)
+            except Exception as e:
+                logger.error(f"Requirements check failed: {e}")
+            # Returns early (True) as soon as the controller shuts down
+            if shutdown.wait(self.REQ_CHECK_INTERVAL_S):
+                return
     
     def _update_requirements_label(self) -> None:
-        """Update requirements status label."""
-        msgs = self.controller.check_requirements()
-        self.req_label.config(text=' | '.join(msgs))
+        """Update requirements status label from the last background check."""
+        with self._req_lock:
+            text = self._req_text
+        if text is not None and text != self._last_req_text:
+            self._last_req_text = text
+            self._req_text_var.set(text)
     
     def _auto_start_if_enabled(self) -> None:
         """Auto-start OpenOB if enabled."""
@@ -717,18 +926,28 @@ class MainWindow:
     def _start_cooldown(self) -> None:
         """Start cooldown period."""
         self.controller.start_cooldown(5)
-        self._cooldown_tick()
+        self._cooldown_tick(self.controller.state)
     
-    def _cooldown_tick(self) -> None:
-        """Update cooldown countdown."""
-        state = self.controller.state
+    def _cooldown_tick(self, state: AppState, tick: Optional[int] = None) -> None:
+        """
+        Update cooldown countdown (driven by _tick once per second).
+        
+        tick is the scheduler tick this step runs on; the next step is due
+        COOLDOWN_EVERY ticks after it. Outside _tick it defaults to the last
+        tick that fired.
+        """
+        self._last_btn_key = None  # button is written directly below
         
         if state.cooldown_remaining > 0:
             self.controller.tick_cooldown()
-            self.main_action_btn.configure(text=f'Espera {state.cooldown_remaining}s')
-            self.root.after(1000, self._cooldown_tick)
+            self._btn_text_var.set(f'Espera {state.cooldown_remaining}s')
+            if tick is None:
+                tick = self._tick_count - 1
+            self._cooldown_due = tick + self.COOLDOWN_EVERY
         else:
-            self.main_action_btn.configure(text='Start', state='normal')
+            self._cooldown_due = None
+            self._btn_text_var.set('Start')
+            self.main_action_btn.configure(state='normal')
     
     def _on_settings_click(self) -> None:
         """Open configuration view (AudioBridge Pro style)."""
@@ -743,96 +962,164 @@ class MainWindow:
         
         try:
             logger.info("Opening ConfigView...")
-            from .components.config import ConfigView, ConfigController, ConfigState, TransmissionMode
+            from .components.config import ConfigView, ConfigController
             
-            # Get current args from controller to determine mode
+            # Reuse the state built on a previous click while args are unchanged
+            # (handing out a copy: the view's controller mutates its state)
             current_args = self.controller.current_args
-            is_rx_mode = " rx " in current_args or current_args.endswith(" rx")
-            
-            # Create initial state from current settings
-            initial_state = ConfigState(
-                transmission_mode=TransmissionMode.RX if is_rx_mode else TransmissionMode.TX
-            )
-            
-            # Parse current args into state
-            link_config = self.controller.get_link_config()
-            if link_config:
-                if is_rx_mode:
-                    initial_state.rx_config_host = link_config.config_host or initial_state.rx_config_host
-                    initial_state.rx_node_name = link_config.node_id or initial_state.rx_node_name
-                    initial_state.rx_link_name = link_config.link_name or initial_state.rx_link_name
-                    initial_state.rx_audio_backend = link_config.audio_backend or initial_state.rx_audio_backend
-                else:
-                    initial_state.tx_config_host = link_config.config_host or initial_state.tx_config_host
-                    initial_state.tx_node_name = link_config.node_id or initial_state.tx_node_name
-                    initial_state.tx_link_name = link_config.link_name or initial_state.tx_link_name
-                    initial_state.tx_peer_ip = link_config.peer_ip or initial_state.tx_peer_ip
-                    initial_state.tx_encoding = link_config.encoding or initial_state.tx_encoding
-                    initial_state.tx_sample_rate = link_config.sample_rate or initial_state.tx_sample_rate
-                    initial_state.tx_jitter_buffer = link_config.jitter_buffer or initial_state.tx_jitter_buffer
-                    initial_state.tx_audio_backend = link_config.audio_backend or initial_state.tx_audio_backend
-            
-            controller = ConfigController(initial_state)
-            
-            def on_config_close(result):
-                if result and result.saved:
-                    self.controller.set_args(result.args)
-                    logger.info(f"Configuration updated: {result.args}")
+            cached = self._settings_state_cache
+            if cached is not None and cached[0] == current_args:
+                initial_state = dataclasses.replace(cached[1])
+            else:
+                initial_state = self._build_config_state(current_args)
+                self._settings_state_cache = (current_args, dataclasses.replace(initial_state))
             
-            dialog = ConfigView(
-                self.root,
-                controller,
-                on_close=on_config_close,
-                on_home=lambda: None  # Just close when Home is clicked
-            )
-            logger.info(f"ConfigView created: {dialog}")
-            self.root.wait_window(dialog)
-            logger.info("ConfigView closed")
+            # The view is built once and then hidden/re-shown on later clicks;
+            # it stays modal (grab) while visible
+            dialog = self._config_view
+            if dialog is None or not dialog.winfo_exists():
+                dialog = ConfigView(
+                    self.root,
+                    ConfigController(initial_state),
+                    on_close=self._on_config_close,
+                    on_home=lambda: None,  # Just close when Home is clicked
+                    hide_on_close=True
+                )
+                self._config_view = dialog
+                logger.info(f"ConfigView created: {dialog}")
+            else:
+                dialog.show(initial_state)
             
         except Exception as e:
             logger.error(f"Error opening ConfigView: {e}", exc_info=True)
     
+    def _build_config_state(self, current_args: str):
+        """Build the ConfigView state from the current OpenOB args."""
+        from .components.config import ConfigState, TransmissionMode
+        
+        is_rx_mode = " rx " in current_args or current_args.endswith(" rx")
+        
+        # Create initial state from current settings
+        initial_state = ConfigState(
+            transmission_mode=TransmissionMode.RX if is_rx_mode else TransmissionMode.TX
+        )
+        
+        # Parse current args into state
+        link_config = self.controller.get_link_config()
+        if link_config:
+            if is_rx_mode:
+                initial_state.rx_config_host = link_config.config_host or initial_state.rx_config_host
+                initial_state.rx_node_name = link_config.node_id or initial_state.rx_node_name
+                initial_state.rx_link_name = link_config.link_name or initial_state.rx_link_name
+                initial_state.rx_audio_backend = link_config.audio_backend or initial_state.rx_audio_backend
+            else:
+                initial_state.tx_config_host = link_config.config_host or initial_state.tx_config_host
+                initial_state.tx_node_name = link_config.node_id or initial_state.tx_node_name
+                initial_state.tx_link_name = link_config.link_name or initial_state.tx_link_name
+                initial_state.tx_peer_ip = link_config.peer_ip or initial_state.tx_peer_ip
+                initial_state.tx_encoding = link_config.encoding or initial_state.tx_encoding
+                initial_state.tx_sample_rate = link_config.sample_rate or initial_state.tx_sample_rate
+                initial_state.tx_jitter_buffer = link_config.jitter_buffer or initial_state.tx_jitter_buffer
+                initial_state.tx_audio_backend = link_config.audio_backend or initial_state.tx_audio_backend
+        
+        return initial_state
+    
+    def _on_config_close(self, result) -> None:
+        """Apply the configuration chosen in the ConfigView."""
+        logger.info("ConfigView closed")
+        if result and result.saved:
+            self.controller.set_args(result.args)
+            logger.info(f"Configuration updated: {result.args}")
+    
     def _toggle_logs(self) -> None:
         """Toggle logs panel visibility."""
         if self._logs_visible:
             self.log_frame.place_forget()
             self._logs_visible = False
         else:
+            if self.log_frame is None:
+                self._create_logs_panel()
             self.log_frame.place(
                 x=20,
-                y=self.config.height - 220,
-                width=self.config.width - 40,
+                y=self._height - 220,
+                width=self._width - 40,
                 height=200
             )
             self.log_frame.lift()
             self._logs_visible = True
+            # Replay what was buffered while hidden (last LOG_QUEUE_MAX lines)
+            # with a single insert
+            self._flush_logs()
     
     def _on_log_message(self, text: str) -> None:
         """Handle log message from controller - thread-safe."""
-        # Schedule on main thread to avoid Tkinter threading issues
-        self.root.after(0, lambda: self.append_log(text))
+        self.append_log(text)
     
     def append_log(self, text: str) -> None:
-        """Append text to log widget."""
-        self.log_widget.configure(state='normal')
-        
-        tag = None
-        if 'ERROR' in text.upper():
-            tag = 'ERROR'
-        elif 'WARN' in text.upper():
-            tag = 'WARN'
-        elif 'INFO' in text.upper():
-            tag = 'INFO'
-        elif 'OBBROADCAST' in text.upper():
-            tag = 'OBBROADCAST'
-        
-        if tag:
-            self.log_widget.insert('end', text, tag)
-        else:
-            self.log_widget.insert('end', text)
+        """Queue text for the log widget; safe to call from any thread."""
+        # SimpleQueue.put never blocks and needs no Tk call: the UI thread
+        # picks lines up in _pump_logs. Classify once here, in the producer.
+        self._log_q.put((self._log_tag(text), text))
+    
+    def _pump_logs(self) -> None:
+        """Move lines from the thread-safe queue to the widget buffer."""
+        log_q = self._log_q
+        pending = self._log_queue
+        while True:
+            try:
+                pending.append(log_q.get_nowait())
+            except queue.Empty:
+                break
         
-        self.log_widget.see('end')
-        self.log_widget.configure(state='disabled')
+        # Hidden panel: lines only accumulate in the bounded buffer, no Tk work
+        if self._logs_visible:
+            self._flush_logs()
+    
+    def _flush_logs(self) -> None:
+        """Write all buffered log lines, one text run per consecutive tag."""
+        # While hidden, lines stay buffered (bounded) until the panel is shown
+        if not self._logs_visible or not self._log_queue:
+            return
+        entries = list(self._log_queue)
+        self._log_queue.clear()
+        
+        # Merge consecutive lines sharing a tag into a single text run
+        chunks = []
+        run_tag, run = entries[0][0], []
+        for tag, text in entries:
+            if tag != run_tag:
+                chunks.append(''.join(run))
+                chunks.append(run_tag)
+                run_tag, run = tag, []
+            run.append(text)
+        chunks.append(''.join(run))
+        chunks.append(run_tag)
+        
+        log_widget = self.log_widget
+        log_widget.configure(state='normal')
+        log_widget.insert('end', *chunks)
+        
+        # Prune once per flush so the text (and its layout work) stays bounded
+        line_count = int(log_widget.index('end-1c').split('.')[0])
+        if line_count > self.LOG_MAX_LINES:
+            log_widget.delete('1.0', f'end-{self.LOG_MAX_LINES}l linestart')
+        
+        # Scroll once for the whole batch
+        log_widget.see('end')
+        log_widget.configure(state='disabled')
+    
+    @staticmethod
+    def _log_tag(text: str) -> str:
+        """Pick the highlight tag for a log line ('' for none)."""
+        # One regex pass; the highest-priority keyword wins, as before
+        best = None
+        for m in _LOG_TAG_RE.finditer(text):
+            keyword = m.group(0).upper()
+            if best is None or _LOG_TAG_PRIORITY[keyword] < _LOG_TAG_PRIORITY[best]:
+                best = keyword
+                if best == 'ERROR':
+                    break
+        return _LOG_TAG_MAP[best] if best else ''
     
     def _on_close(self) -> None:
         """Handle window close request."""
@@ -854,7 +1141,19 @@ class MainWindow:
     def _cleanup_and_close(self) -> None:
         """Clean up and close."""
         logger.info("Closing application")
-        self.controller.cleanup()
+        if self._config_view is not None and self._config_view.winfo_exists():
+            self._config_view.destroy()
+        for after_id in self._after_ids:
+            try:
+                self.root.after_cancel(after_id)
+            except Exception:
+                pass
+        self._after_ids.clear()
+        self.controller.cleanup()  # also sets controller.shutdown_event
+        if self._req_thread is not None:
+            # Bounded: a check already in progress may take longer; it is a
+            # daemon thread, so closing does not wait on it
+            self._req_thread.join(timeout=1.0)
         self.root.destroy()
     
     def run(self) -> None:
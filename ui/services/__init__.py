@@ -1,35 +1,47 @@
 # -*- coding: utf-8 -*-
 """
 Services module - External services and utilities.
+
+The Redis, process and config storage services are imported lazily on
+first attribute access (PEP 562), so importing a light submodule such as
+``services.utils`` does not pull in redis or subprocess machinery.
 """
 
-from .redis_service import RedisService, VUData
-from .process_service import (
-    RedisServiceManager,
-    OpenOBProcessManager,
-    RequirementsChecker,
-    ServiceStatus,
-    ProcessResult
-)
+import importlib
+
 from .utils import (
     configure_logging,
+    shutdown_logging,
     get_logger,
     db_to_normalized,
     apply_vu_jitter,
     smooth_value,
     simulate_vu_level
 )
-from .config_storage import ConfigStorageService, SavedConfig
+
+# Public name -> submodule that defines it
+_LAZY = {
+    'RedisService': '.redis_service',
+    'VUData': '.redis_service',
+    'RedisServiceManager': '.process_service',
+    'OpenOBProcessManager': '.process_service',
+    'RequirementsChecker': '.process_service',
+    'ServiceStatus': '.process_service',
+    'ProcessResult': '.process_service',
+    'ConfigStorageService': '.config_storage',
+    'SavedConfig': '.config_storage',
+}
 
 __all__ = [
     'RedisService',
     'VUData',
     'RedisServiceManager',
-    'OpenOBProcessManager', 
+    'OpenOBProcessManager',
     'RequirementsChecker',
     'ServiceStatus',
     'ProcessResult',
     'configure_logging',
+    'shutdown_logging',
     'get_logger',
     'db_to_normalized',
     'apply_vu_jitter',
@@ -37,4 +49,17 @@ __all__ = [
     'simulate_vu_level',
     'ConfigStorageService',
     'SavedConfig',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -7,12 +7,49 @@ Handles saving and loading application settings to/from JSON file.
 
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Optional, Dict, Any
-from dataclasses import dataclass, asdict
+from typing import Optional, Dict, Any, List, Tuple
+from dataclasses import dataclass, asdict, fields
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
 
 logger = logging.getLogger('openob.ui.config_storage')
 
+# OpenOB option flags emitted per mode, in command line order: (flag, field)
+_TX_FLAGS = (
+    ('-e', 'tx_encoding'),
+    ('-r', 'tx_sample_rate'),
+    ('-j', 'tx_jitter_buffer'),
+    ('-a', 'tx_audio_backend'),
+)
+_RX_FLAGS = (
+    ('-a', 'rx_audio_backend'),
+    ('-d', 'rx_alsa_device'),
+)
+# The same tables keyed by flag, for parsing arguments back into fields
+_TX_OPTS = dict(_TX_FLAGS)
+_RX_OPTS = dict(_RX_FLAGS)
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize to indented UTF-8 JSON (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """Parse UTF-8 JSON bytes (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 @dataclass
 class SavedConfig:
@@ -59,16 +96,7 @@ class SavedConfig:
             "tx",
             self.tx_peer_ip,
         ]
-        
-        if self.tx_encoding:
-            parts.extend(["-e", self.tx_encoding])
-        if self.tx_sample_rate:
-            parts.extend(["-r", self.tx_sample_rate])
-        if self.tx_jitter_buffer:
-            parts.extend(["-j", self.tx_jitter_buffer])
-        if self.tx_audio_backend:
-            parts.extend(["-a", self.tx_audio_backend])
-        
+        parts += self._flag_args(_TX_FLAGS)
         return " ".join(parts)
     
     def _get_rx_args(self) -> str:
@@ -79,13 +107,26 @@ class SavedConfig:
             self.rx_link_name,
             "rx",
         ]
-        
-        if self.rx_audio_backend:
-            parts.extend(["-a", self.rx_audio_backend])
-        if self.rx_alsa_device:
-            parts.extend(["-d", self.rx_alsa_device])
-        
+        parts += self._flag_args(_RX_FLAGS)
         return " ".join(parts)
+    
+    def _flag_args(self, flags: Tuple[Tuple[str, str], ...]) -> List[str]:
+        """Flatten (flag, field) pairs into [flag, value, ...], skipping empty values."""
+        return [
+            token
+            for flag, attr in flags
+            for value in (getattr(self, attr),) if value
+            for token in (flag, value)
+        ]
+
+
+# (name, default) for every SavedConfig field, resolved once at import
+_SAVED_CFG_FIELDS = tuple((f.name, f.default) for f in fields(SavedConfig))
+
+# OpenOB positional argument layout per mode (None = the mode word itself,
+# not stored); options are parsed with _TX_OPTS / _RX_OPTS
+_TX_POSITIONALS = ('tx_config_host', 'tx_node_name', 'tx_link_name', None, 'tx_peer_ip')
+_RX_POSITIONALS = ('rx_config_host', 'rx_node_name', 'rx_link_name', None)
 
 
 class ConfigStorageService:
@@ -130,28 +171,12 @@ class ConfigStorageService:
             return self._config
         
         try:
-            with open(self._config_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _loads(self._config_file.read_bytes())
             
-            # Update config with loaded values
-            self._config = SavedConfig(
-                transmission_mode=data.get('transmission_mode', 'tx'),
-                vpn_enabled=data.get('vpn_enabled', False),
-                tx_config_host=data.get('tx_config_host', '127.0.0.1'),
-                tx_node_name=data.get('tx_node_name', 'emetteur'),
-                tx_link_name=data.get('tx_link_name', 'transmission'),
-                tx_peer_ip=data.get('tx_peer_ip', '192.168.1.17'),
-                tx_encoding=data.get('tx_encoding', 'pcm'),
-                tx_sample_rate=data.get('tx_sample_rate', '48000'),
-                tx_jitter_buffer=data.get('tx_jitter_buffer', '60'),
-                tx_audio_backend=data.get('tx_audio_backend', 'auto'),
-                rx_config_host=data.get('rx_config_host', '192.168.1.15'),
-                rx_node_name=data.get('rx_node_name', 'recepteur'),
-                rx_link_name=data.get('rx_link_name', 'transmission'),
-                rx_audio_backend=data.get('rx_audio_backend', 'auto'),
-                rx_alsa_device=data.get('rx_alsa_device', ''),
-                auto_start=data.get('auto_start', True),
-            )
+            # Update config with loaded values (missing keys keep the defaults)
+            self._config = SavedConfig(**{
+                name: data.get(name, default) for name, default in _SAVED_CFG_FIELDS
+            })
             
             logger.info(f"Loaded config from {self._config_file}: mode={self._config.transmission_mode}")
             return self._config
@@ -174,9 +199,11 @@ class ConfigStorageService:
             # Convert to dict
             data = asdict(self._config)
             
-            # Save to file
-            with open(self._config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Write a temp file and swap it in, so a crash mid-write never
+            # leaves a truncated settings file behind
+            tmp_file = self._config_file.with_suffix('.tmp')
+            tmp_file.write_bytes(_dumps(data))
+            os.replace(tmp_file, self._config_file)
             
             logger.info(f"Saved config to {self._config_file}: mode={self._config.transmission_mode}")
             return True
@@ -211,43 +238,22 @@ class ConfigStorageService:
             return
         
         if mode == 'tx':
-            self._config.tx_config_host = parts[0] if len(parts) > 0 else self._config.tx_config_host
-            self._config.tx_node_name = parts[1] if len(parts) > 1 else self._config.tx_node_name
-            self._config.tx_link_name = parts[2] if len(parts) > 2 else self._config.tx_link_name
-            # parts[3] is 'tx'
-            self._config.tx_peer_ip = parts[4] if len(parts) > 4 else self._config.tx_peer_ip
-            
-            # Parse options
-            i = 5
-            while i < len(parts):
-                if parts[i] == '-e' and i + 1 < len(parts):
-                    self._config.tx_encoding = parts[i + 1]
-                    i += 2
-                elif parts[i] == '-r' and i + 1 < len(parts):
-                    self._config.tx_sample_rate = parts[i + 1]
-                    i += 2
-                elif parts[i] == '-j' and i + 1 < len(parts):
-                    self._config.tx_jitter_buffer = parts[i + 1]
-                    i += 2
-                elif parts[i] == '-a' and i + 1 < len(parts):
-                    self._config.tx_audio_backend = parts[i + 1]
-                    i += 2
-                else:
-                    i += 1
+            positionals, opts = _TX_POSITIONALS, _TX_OPTS
         else:  # rx
-            self._config.rx_config_host = parts[0] if len(parts) > 0 else self._config.rx_config_host
-            self._config.rx_node_name = parts[1] if len(parts) > 1 else self._config.rx_node_name
-            self._config.rx_link_name = parts[2] if len(parts) > 2 else self._config.rx_link_name
-            # parts[3] is 'rx'
-            
-            # Parse options
-            i = 4
-            while i < len(parts):
-                if parts[i] == '-a' and i + 1 < len(parts):
-                    self._config.rx_audio_backend = parts[i + 1]
-                    i += 2
-                elif parts[i] == '-d' and i + 1 < len(parts):
-                    self._config.rx_alsa_device = parts[i + 1]
-                    i += 2
-                else:
-                    i += 1
+            positionals, opts = _RX_POSITIONALS, _RX_OPTS
+        
+        # Positional fields (zip stops early if the TX peer IP is missing)
+        config = self._config
+        for attr, value in zip(positionals, parts):
+            if attr:
+                setattr(config, attr, value)
+        
+        # Options: a known flag consumes the next token as its value,
+        # anything else is skipped on its own
+        it = iter(parts[len(positionals):])
+        for token in it:
+            attr = opts.get(token)
+            if attr:
+                value = next(it, None)
+                if value is not None:
+                    setattr(config, attr, value)
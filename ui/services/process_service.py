@@ -9,21 +9,40 @@ Design decisions:
 - Handles process lifecycle (start, stop, status check)
 """
 
+import functools
+import locale
+import os
+import queue
 import subprocess
 import threading
 import shlex
 import time
 import logging
 from pathlib import Path
-from typing import Optional, Callable, List
+from typing import Optional, Callable, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from .win_scm import HAS_SCM, ServiceHandle, SERVICE_RUNNING, SERVICE_STOPPED
+
 logger = logging.getLogger('openob.ui.process')
 
 # Hide PowerShell windows on Windows
 CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
 
+# One hidden-window STARTUPINFO shared by every spawn (Windows only; Popen
+# copies it per call, so reusing the instance is safe)
+if hasattr(subprocess, 'STARTUPINFO'):
+    STARTUP_INFO = subprocess.STARTUPINFO(
+        dwFlags=subprocess.STARTF_USESHOWWINDOW,
+        wShowWindow=subprocess.SW_HIDE
+    )
+else:
+    STARTUP_INFO = None
+
+# Bytes requested per read of the OpenOB output pipe
+OUTPUT_READ_SIZE = 65536
+
 
 class ServiceStatus(Enum):
     """Windows service status."""
@@ -41,30 +60,191 @@ class ProcessResult:
     return_code: int = 0
 
 
+class PowerShellSession:
+    """
+    One long-lived PowerShell process fed commands over stdin.
+    
+    The interpreter start-up cost is paid once; each command after that is
+    a pipe write plus reading its output up to a sentinel line. Commands
+    are serialized with a lock and the process is re-spawned if it died.
+    A command that produces no sentinel within its timeout gets the session
+    killed, so one wedged command cannot block every later caller.
+    """
+    
+    SENTINEL = "__OPENOB_PS_END__"
+    COMMAND_TIMEOUT = 30.0  # seconds run() waits for a command to finish
+    
+    def __init__(self, working_dir: Optional[Path] = None):
+        self._working_dir = working_dir
+        self._proc: Optional[subprocess.Popen] = None
+        self._lines: Optional[queue.SimpleQueue] = None  # stdout lines, None at EOF
+        self._lock = threading.Lock()
+    
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ['powershell', '-NoProfile', '-NonInteractive', '-Command', '-'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                cwd=str(self._working_dir) if self._working_dir else None,
+                creationflags=CREATION_FLAGS,
+                startupinfo=STARTUP_INFO
+            )
+            # stdout is read on a helper thread so run() can wait with a deadline
+            self._lines = queue.SimpleQueue()
+            threading.Thread(
+                target=self._read_lines,
+                args=(self._proc.stdout, self._lines),
+                daemon=True
+            ).start()
+        return self._proc
+    
+    @staticmethod
+    def _read_lines(stdout, lines: queue.SimpleQueue) -> None:
+        """Forward one session's stdout lines to its queue, then None at EOF."""
+        try:
+            for line in stdout:
+                lines.put(line)
+        except (OSError, ValueError):
+            pass  # pipe closed by _kill()/close()
+        finally:
+            lines.put(None)
+    
+    def run(self, command: str, timeout: Optional[float] = None) -> tuple[bool, str]:
+        """
+        Run a single-line command.
+        
+        Args:
+            command: PowerShell command
+            timeout: Seconds to wait for it (default: COMMAND_TIMEOUT). On
+                timeout the session is killed and re-spawned by the next call
+        
+        Returns:
+            Tuple of (succeeded per $?, output including error text)
+        """
+        if timeout is None:
+            timeout = self.COMMAND_TIMEOUT
+        with self._lock:
+            proc = self._ensure_started()
+            lines_q = self._lines
+            proc.stdin.write(f"{command}\n\"{self.SENTINEL}$?\"\n")
+            proc.stdin.flush()
+            
+            deadline = time.monotonic() + timeout
+            lines = []
+            while True:
+                try:
+                    line = lines_q.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    logger.warning("PowerShell command timed out after %.1fs: %s", timeout, command)
+                    self._kill()
+                    return False, f"PowerShell command timed out after {timeout:.1f}s"
+                if line is None:
+                    raise OSError("PowerShell session exited unexpectedly")
+                if line.startswith(self.SENTINEL):
+                    return line.rstrip().endswith('True'), ''.join(lines)
+                lines.append(line)
+    
+    def _kill(self) -> None:
+        """Kill the session (lock held); the next run() starts a new one."""
+        proc, self._proc, self._lines = self._proc, None, None
+        if proc is not None:
+            try:
+                proc.kill()
+                proc.wait(timeout=1.0)
+            except Exception:
+                pass
+    
+    def close(self) -> None:
+        """Ask the session to exit (safe to call repeatedly)."""
+        with self._lock:
+            proc, self._proc, self._lines = self._proc, None, None
+        if proc and proc.poll() is None:
+            try:
+                proc.stdin.write("exit\n")
+                proc.stdin.close()
+                proc.wait(timeout=2.0)
+            except Exception:
+                proc.kill()
+
+
 class RedisServiceManager:
     """
     Manages the Redis Windows service.
     
-    Uses PowerShell to start/stop/check Redis service status.
+    Talks to the Service Control Manager directly on Windows and falls
+    back to a shared PowerShell session when the SCM path is unavailable
+    or fails.
     """
     
     SERVICE_NAME = "Redis"
+    STATUS_TTL = 1.0  # seconds a status read is reused
+    PS_STATUS_TIMEOUT = 5.0  # seconds a PowerShell status query may take
     
     def __init__(self, working_dir: Optional[Path] = None):
         self._working_dir = working_dir
+        self._scm: Optional[ServiceHandle] = ServiceHandle(self.SERVICE_NAME) if HAS_SCM else None
+        self._ps = PowerShellSession(working_dir)  # started on first fallback
+        self._cached_status = ServiceStatus.UNKNOWN
+        self._cached_at = float('-inf')
+    
+    def get_status(self, force_refresh: bool = False) -> ServiceStatus:
+        """
+        Get current Redis service status.
+        
+        Reads within STATUS_TTL of the previous one reuse its result.
+        
+        Args:
+            force_refresh: Always query the service
+        """
+        now = time.monotonic()
+        if not force_refresh and now - self._cached_at < self.STATUS_TTL:
+            return self._cached_status
+        
+        status = self._query_status()
+        self._cached_status, self._cached_at = status, now
+        return status
+    
+    def _invalidate_status(self) -> None:
+        """Force the next get_status() to query the service."""
+        self._cached_at = float('-inf')
     
-    def get_status(self) -> ServiceStatus:
-        """Get current Redis service status."""
+    def _query_status(self) -> ServiceStatus:
+        """Query the Redis service status (SCM, else PowerShell)."""
+        status = self._query_scm_status()
+        if status is not None:
+            return status
+        return self._query_ps_status()
+    
+    def _query_scm_status(self) -> Optional[ServiceStatus]:
+        """Status from the SCM, or None when PowerShell must be used."""
+        if not self._scm:
+            return None
         try:
-            result = subprocess.run(
-                ['powershell', '-NoProfile', '-Command',
-                 f"(Get-Service -Name {self.SERVICE_NAME} -ErrorAction SilentlyContinue).Status -join ''"],
-                capture_output=True,
-                text=True,
-                cwd=str(self._working_dir) if self._working_dir else None,
-                creationflags=CREATION_FLAGS
+            state = self._scm.query_state()
+        except OSError as e:
+            logger.debug("SCM status query failed, using PowerShell: %s", e)
+            return None
+        
+        if state == SERVICE_RUNNING:
+            return ServiceStatus.RUNNING
+        elif state == SERVICE_STOPPED:
+            return ServiceStatus.STOPPED
+        elif state is None:
+            return ServiceStatus.NOT_INSTALLED
+        else:
+            return ServiceStatus.UNKNOWN
+    
+    def _query_ps_status(self) -> ServiceStatus:
+        """Status from Get-Service in the PowerShell session."""
+        try:
+            _, output = self._ps.run(
+                f"(Get-Service -Name {self.SERVICE_NAME} -ErrorAction SilentlyContinue).Status -join ''",
+                timeout=self.PS_STATUS_TIMEOUT
             )
-            status = result.stdout.strip()
+            status = output.strip()
             
             if status == "Running":
                 return ServiceStatus.RUNNING
@@ -76,62 +256,78 @@ class RedisServiceManager:
                 return ServiceStatus.UNKNOWN
                 
         except Exception as e:
-            logger.warning(f"Failed to check Redis service status: {e}")
+            logger.warning("Failed to check Redis service status: %s", e)
             return ServiceStatus.UNKNOWN
     
     def start(self) -> ProcessResult:
         """Start the Redis service."""
+        if self._scm:
+            try:
+                if self._scm.start():
+                    self._invalidate_status()
+                    logger.info("Redis service started successfully")
+                    return ProcessResult(success=True, message="Redis service started")
+                logger.warning("Redis service did not reach Running state in time")
+                return ProcessResult(success=False, message="Timed out starting Redis")
+            except OSError as e:
+                logger.debug("SCM start failed, using PowerShell: %s", e)
+        
         try:
-            result = subprocess.run(
-                ['powershell', '-NoProfile', '-Command', 
-                 f'Start-Service -Name {self.SERVICE_NAME}'],
-                capture_output=True,
-                text=True,
-                cwd=str(self._working_dir) if self._working_dir else None,
-                creationflags=CREATION_FLAGS
-            )
+            ok, output = self._ps.run(f'Start-Service -Name {self.SERVICE_NAME}')
             
-            if result.returncode == 0:
+            if ok:
+                self._invalidate_status()
                 logger.info("Redis service started successfully")
                 return ProcessResult(success=True, message="Redis service started")
             else:
-                logger.error(f"Failed to start Redis: {result.stderr}")
+                logger.error("Failed to start Redis: %s", output)
                 return ProcessResult(
                     success=False, 
-                    message=f"Failed to start Redis: {result.stderr}",
-                    return_code=result.returncode
+                    message=f"Failed to start Redis: {output}",
+                    return_code=1
                 )
                 
         except Exception as e:
-            logger.error(f"Exception starting Redis: {e}")
+            logger.error("Exception starting Redis: %s", e)
             return ProcessResult(success=False, message=str(e))
     
     def stop(self) -> ProcessResult:
         """Stop the Redis service."""
+        if self._scm:
+            try:
+                if self._scm.stop():
+                    self._invalidate_status()
+                    logger.info("Redis service stopped successfully")
+                    return ProcessResult(success=True, message="Redis service stopped")
+                logger.warning("Redis service did not reach Stopped state in time")
+                return ProcessResult(success=False, message="Timed out stopping Redis")
+            except OSError as e:
+                logger.debug("SCM stop failed, using PowerShell: %s", e)
+        
         try:
-            result = subprocess.run(
-                ['powershell', '-NoProfile', '-Command', 
-                 f'Stop-Service -Name {self.SERVICE_NAME} -Force'],
-                capture_output=True,
-                text=True,
-                cwd=str(self._working_dir) if self._working_dir else None,
-                creationflags=CREATION_FLAGS
-            )
+            ok, output = self._ps.run(f'Stop-Service -Name {self.SERVICE_NAME} -Force')
             
-            if result.returncode == 0:
+            if ok:
+                self._invalidate_status()
                 logger.info("Redis service stopped successfully")
                 return ProcessResult(success=True, message="Redis service stopped")
             else:
-                logger.error(f"Failed to stop Redis: {result.stderr}")
+                logger.error("Failed to stop Redis: %s", output)
                 return ProcessResult(
                     success=False,
-                    message=f"Failed to stop Redis: {result.stderr}",
-                    return_code=result.returncode
+                    message=f"Failed to stop Redis: {output}",
+                    return_code=1
                 )
                 
         except Exception as e:
-            logger.error(f"Exception stopping Redis: {e}")
+            logger.error("Exception stopping Redis: %s", e)
             return ProcessResult(success=False, message=str(e))
+    
+    def close(self) -> None:
+        """Release the PowerShell session and SCM handles."""
+        self._ps.close()
+        if self._scm:
+            self._scm.close()
 
 
 class OpenOBProcessManager:
@@ -216,7 +412,8 @@ class OpenOBProcessManager:
         
         Args:
             args: OpenOB command line arguments
-            output_callback: Optional callback for stdout lines
+            output_callback: Optional callback for stdout lines, called on
+                the reader thread
             use_fallback: Use fallback PowerShell script instead
             
         Returns:
@@ -228,9 +425,13 @@ class OpenOBProcessManager:
         if not args.strip():
             return ProcessResult(success=False, message="Empty OpenOB arguments")
         
-        try:
-            split_args = shlex.split(args)
-        except Exception:
+        # shlex is only needed when the string has quoting or escapes
+        if any(c in args for c in '"\'\\'):
+            try:
+                split_args = shlex.split(args)
+            except Exception:
+                split_args = args.split()
+        else:
             split_args = args.split()
         
         try:
@@ -243,7 +444,7 @@ class OpenOBProcessManager:
             else:
                 # Always use python.exe to run the openob script
                 cmd = [str(self._venv_python), str(self._openob_script)] + split_args
-                logger.info(f"OpenOB command: {' '.join(cmd)}")
+                logger.info("OpenOB command: %s", ' '.join(cmd))
             
             # Get environment with GStreamer paths
             env = self._get_gstreamer_env()
@@ -252,27 +453,27 @@ class OpenOBProcessManager:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
                 env=env,
                 cwd=str(self._working_dir) if self._working_dir else None,
-                creationflags=CREATION_FLAGS
+                creationflags=CREATION_FLAGS,
+                startupinfo=STARTUP_INFO
             )
             
             # Start output streaming thread
             if output_callback:
                 self._output_thread = threading.Thread(
                     target=self._stream_output,
-                    args=(output_callback,),
+                    args=(self._process.stdout, output_callback),
                     daemon=True
                 )
                 self._output_thread.start()
             
             method = "fallback script" if use_fallback else "direct venv"
-            logger.info(f"Started OpenOB ({method})")
+            logger.info("Started OpenOB (%s)", method)
             return ProcessResult(success=True, message=f"Started OpenOB ({method})")
             
         except Exception as e:
-            logger.error(f"Failed to start OpenOB: {e}")
+            logger.error("Failed to start OpenOB: %s", e)
             return ProcessResult(success=False, message=str(e))
     
     def stop(self, timeout: float = 3.0) -> ProcessResult:
@@ -293,31 +494,92 @@ class OpenOBProcessManager:
             self._process.terminate()
             logger.info("Sent terminate signal to OpenOB")
             
+            # On Windows Popen.wait(timeout) is a single WaitForSingleObject
+            # on the process handle, so this blocks in the kernel, not a loop
             try:
                 self._process.wait(timeout=timeout)
                 logger.info("OpenOB terminated gracefully")
             except subprocess.TimeoutExpired:
-                # Force kill
+                # Force kill, then reap so the exit code and handle are released
                 self._process.kill()
+                self._process.wait(timeout=timeout)
                 logger.warning("OpenOB force killed after timeout")
             
             self._process = None
             return ProcessResult(success=True, message="OpenOB stopped")
             
         except Exception as e:
-            logger.error(f"Error stopping OpenOB: {e}")
+            logger.error("Error stopping OpenOB: %s", e)
             self._process = None
             return ProcessResult(success=False, message=str(e))
     
-    def _stream_output(self, callback: Callable[[str], None]) -> None:
-        """Stream process output to callback."""
+    @staticmethod
+    def _stream_output(stdout, callback: Callable[[str], None]) -> None:
+        """
+        Stream process output to callback, one line per call.
+        
+        Reads the raw pipe in OUTPUT_READ_SIZE chunks and only decodes
+        complete lines, so a multi-byte character split across reads
+        stays intact. Lines are split on LF only and keep it, as in text
+        mode; the CR of a Windows CRLF ending is dropped.
+        """
+        encoding = locale.getpreferredencoding(False)
+        pending = b''
         try:
-            if self._process and self._process.stdout:
-                for line in self._process.stdout:
-                    if line:
-                        callback(line)
+            fd = stdout.fileno()
+            while True:
+                chunk = os.read(fd, OUTPUT_READ_SIZE)
+                if not chunk:
+                    break
+                
+                cut = chunk.rfind(b'\n') + 1
+                if not cut:
+                    pending += chunk
+                    continue
+                text = (pending + chunk[:cut]).decode(encoding, 'replace')
+                pending = chunk[cut:]
+                
+                # text ends with '\n': the last split item is empty
+                for line in text.split('\n')[:-1]:
+                    if line.endswith('\r'):
+                        line = line[:-1]
+                    callback(line + '\n')
+            
+            # Unterminated last line at EOF
+            if pending:
+                tail = pending.decode(encoding, 'replace')
+                callback(tail[:-1] if tail.endswith('\r') else tail)
         except Exception as e:
-            logger.debug(f"Output streaming ended: {e}")
+            logger.debug("Output streaming ended: %s", e)
+
+
+@functools.lru_cache(maxsize=1)
+def _check_python_modules() -> Tuple[str, ...]:
+    """
+    Import-check the Python modules OpenOB needs, once per process.
+    
+    Not done at module import: app.setup_environment() sets the GStreamer
+    typelib path after this module is loaded, and the gi probe needs it.
+    """
+    messages = []
+    
+    # Check Redis library
+    try:
+        import redis
+        messages.append("redis: OK")
+    except ImportError:
+        messages.append("redis: MISSING")
+    
+    # Check GStreamer bindings
+    try:
+        import gi
+        gi.require_version('Gst', '1.0')
+        from gi.repository import Gst
+        messages.append("gi/Gst: OK")
+    except Exception:
+        messages.append("gi/Gst: MISSING")
+    
+    return tuple(messages)
 
 
 class RequirementsChecker:
@@ -325,50 +587,67 @@ class RequirementsChecker:
     Checks system requirements for the application.
     """
     
-    def __init__(self, gstreamer_bin: Path, working_dir: Optional[Path] = None):
+    CHECK_TTL = 2.0  # seconds a check_all() result is reused
+    
+    def __init__(
+        self,
+        gstreamer_bin: Path,
+        working_dir: Optional[Path] = None,
+        redis_manager: Optional[RedisServiceManager] = None
+    ):
         self._gstreamer_bin = gstreamer_bin
         self._working_dir = working_dir
-        self._redis_manager = RedisServiceManager(working_dir)
+        # Share the caller's manager so its status cache is shared too
+        self._redis_manager = redis_manager or RedisServiceManager(working_dir)
+        self._redis_status = ServiceStatus.UNKNOWN
+        self._last_check: Tuple[float, List[str]] = (float('-inf'), [])
     
-    def check_all(self) -> List[str]:
+    @property
+    def redis_status(self) -> ServiceStatus:
+        """Redis service status read by the last check_all()."""
+        return self._redis_status
+    
+    def check_all(self, force_refresh: bool = False) -> List[str]:
         """
         Check all requirements.
         
+        Results within CHECK_TTL of the previous check are reused.
+        
+        Args:
+            force_refresh: Always run the checks
+            
         Returns:
             List of status messages
         """
-        messages = []
-        
-        # Check Redis library
-        try:
-            import redis
-            messages.append("redis: OK")
-        except ImportError:
-            messages.append("redis: MISSING")
+        now = time.monotonic()
+        checked_at, cached = self._last_check
+        if not force_refresh and now - checked_at < self.CHECK_TTL:
+            return list(cached)
         
-        # Check GStreamer bindings
-        try:
-            import gi
-            gi.require_version('Gst', '1.0')
-            from gi.repository import Gst
-            messages.append("gi/Gst: OK")
-        except Exception:
-            messages.append("gi/Gst: MISSING")
+        messages = self._check_modules()
+        messages.append(self._check_gstreamer_bins())
         
-        # Check GStreamer binaries
+        # Check Redis service (one query, kept for callers of redis_status)
+        messages.append(self._redis_message(self._redis_manager.get_status()))
+        self._last_check = (now, messages)
+        return list(messages)
+    
+    def _check_modules(self) -> List[str]:
+        """Check the Python modules OpenOB needs (probed once, then cached)."""
+        return list(_check_python_modules())
+    
+    def _check_gstreamer_bins(self) -> str:
+        """Check the GStreamer binaries directory."""
         if self._gstreamer_bin.exists():
-            messages.append("GStreamer bins: OK")
-        else:
-            messages.append(f"GStreamer bins not found at {self._gstreamer_bin}")
-        
-        # Check Redis service
-        status = self._redis_manager.get_status()
+            return "GStreamer bins: OK"
+        return f"GStreamer bins not found at {self._gstreamer_bin}"
+    
+    def _redis_message(self, status: ServiceStatus) -> str:
+        """Record the Redis status snapshot and format its message."""
+        self._redis_status = status
         if status == ServiceStatus.NOT_INSTALLED:
-            messages.append("Redis service: NOT INSTALLED")
-        else:
-            messages.append(f"Redis service: {status.value}")
-        
-        return messages
+            return "Redis service: NOT INSTALLED"
+        return f"Redis service: {status.value}"
     
     def is_redis_running(self) -> bool:
         """Check if Redis service is running."""
@@ -11,7 +11,9 @@ Design decisions:
 
 from __future__ import annotations
 
+import functools
 import re
+import socket
 import time
 import logging
 from dataclasses import dataclass
@@ -27,6 +29,16 @@ except ImportError:
 
 logger = logging.getLogger('openob.ui.redis')
 
+# TCP keepalive tuning (seconds / probes), only for options this platform has
+_KEEPALIVE_OPTIONS = {
+    opt: value
+    for name, value in (('TCP_KEEPIDLE', 5), ('TCP_KEEPINTVL', 2), ('TCP_KEEPCNT', 3))
+    for opt in (getattr(socket, name, None),) if opt is not None
+}
+
+# Numbers inside a combined "audio_level" field, e.g. "[-12.5, -14.0]"
+_NUM_RE = re.compile(r'-?\d+(?:\.\d+)?')
+
 
 @dataclass
 class VUData:
@@ -52,6 +64,8 @@ class RedisService:
     SOCKET_TIMEOUT = 1.0
     # Retry delay after failed connection (seconds)
     RETRY_DELAY = 10.0
+    # PING an idle connection before reuse after this many seconds
+    HEALTH_CHECK_INTERVAL = 5
     
     def __init__(self):
         self._client: Optional[Any] = None  # redis.StrictRedis
@@ -104,7 +118,10 @@ class RedisService:
                 charset='utf-8', 
                 decode_responses=True,
                 socket_timeout=self.SOCKET_TIMEOUT,
-                socket_connect_timeout=self.CONNECT_TIMEOUT
+                socket_connect_timeout=self.CONNECT_TIMEOUT,
+                socket_keepalive=True,
+                socket_keepalive_options=_KEEPALIVE_OPTIONS,
+                health_check_interval=self.HEALTH_CHECK_INTERVAL
             )
             client.ping()
             
@@ -112,11 +129,11 @@ class RedisService:
             self._host = host
             self._port = port
             self._last_failed_host = None  # Clear failed state on success
-            logger.info(f"Connected to Redis at {host}:{port}")
+            logger.info("Connected to Redis at %s:%s", host, port)
             return True
             
         except Exception as e:
-            logger.warning(f"Failed to connect to Redis at {host}:{port}: {e}")
+            logger.warning("Failed to connect to Redis at %s:%s: %s", host, port, e)
             self._client = None
             self._last_failed_attempt = time.time()
             self._last_failed_host = f"{host}:{port}"
@@ -129,13 +146,14 @@ class RedisService:
         self._port = 6379
         self._last_failed_host = None  # Allow immediate reconnection after disconnect
     
-    def fetch_vu_data(self, link_name: str, role: str) -> Optional[VUData]:
+    def fetch_vu_data(self, link_name: str, role: str, now: Optional[float] = None) -> Optional[VUData]:
         """
         Fetch VU data from Redis.
         
         Args:
             link_name: OpenOB link name
             role: 'tx' for transmitter or 'rx' for receiver
+            now: Wall-clock time for the staleness check (default: time.time())
             
         Returns:
             VUData if successful, None otherwise
@@ -148,9 +166,44 @@ class RedisService:
         try:
             data = self._client.hgetall(key)
         except Exception as e:
-            logger.warning(f"Failed to fetch VU data from {key}: {e}")
+            logger.warning("Failed to fetch VU data from %s: %s", key, e)
             return None
         
+        return self._to_vu_data(data, now)
+    
+    def fetch_vu_data_both(
+        self,
+        link_name: str,
+        now: Optional[float] = None
+    ) -> Tuple[Optional[VUData], Optional[VUData]]:
+        """
+        Fetch tx and rx VU data in one pipelined round-trip.
+        
+        Args:
+            link_name: OpenOB link name
+            now: Wall-clock time for the staleness check (default: time.time())
+            
+        Returns:
+            Tuple of (tx VUData, rx VUData), each None if unavailable
+        """
+        if not self._client:
+            return None, None
+        
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            pipe.hgetall(f'openob:{link_name}:vu:tx')
+            pipe.hgetall(f'openob:{link_name}:vu:rx')
+            tx_data, rx_data = pipe.execute()
+        except Exception as e:
+            logger.warning("Failed to fetch VU data for link %s: %s", link_name, e)
+            return None, None
+        
+        if now is None:
+            now = time.time()
+        return self._to_vu_data(tx_data, now), self._to_vu_data(rx_data, now)
+    
+    def _to_vu_data(self, data: dict, now: Optional[float] = None) -> Optional[VUData]:
+        """Build VUData from a VU hash, or None if it has no usable levels."""
         if not data:
             return None
         
@@ -160,11 +213,12 @@ class RedisService:
         if left is None or right is None:
             return None
         
-        # Check timestamp for staleness
+        # Check timestamp for staleness (wall clock: the writer stamps
+        # updated_ts with its own time.time(), so monotonic can't be used)
         timestamp = self._parse_timestamp(data)
         is_stale = False
         if timestamp is not None:
-            age = time.time() - timestamp
+            age = (time.time() if now is None else now) - timestamp
             if age > self.STALE_THRESHOLD:
                 is_stale = True
         
@@ -184,7 +238,7 @@ class RedisService:
         if left is None and right is None:
             combined = data.get('audio_level_db') or data.get('audio_level') or data.get('level')
             if combined:
-                nums = re.findall(r'-?\d+(?:\.\d+)?', str(combined))
+                nums = _NUM_RE.findall(str(combined))
                 if len(nums) >= 2:
                     left, right = nums[-2], nums[-1]
                 elif len(nums) == 1:
@@ -209,12 +263,17 @@ class RedisService:
         return None
     
     @staticmethod
+    @functools.lru_cache(maxsize=16)
     def parse_host_port(raw_host: str) -> Tuple[Optional[str], int]:
         """
         Parse host:port string.
         
+        Results are memoized: callers pass the same configured host on
+        every connect attempt.
+        
         Args:
-            raw_host: String like "127.0.0.1" or "127.0.0.1:6379"
+            raw_host: String like "127.0.0.1", "127.0.0.1:6379", "::1"
+                or "[::1]:6379"
             
         Returns:
             Tuple of (host, port)
@@ -222,11 +281,17 @@ class RedisService:
         if not raw_host:
             return None, 6379
         
-        if ':' in raw_host:
-            parts = raw_host.split(':', 1)
-            try:
-                return parts[0], int(parts[1])
-            except ValueError:
-                return parts[0], 6379
+        if raw_host.startswith('['):
+            # Bracketed IPv6 literal, optionally followed by :port
+            host, _, rest = raw_host[1:].partition(']')
+            port = rest[1:] if rest.startswith(':') else ''
+        elif raw_host.count(':') == 1:
+            host, _, port = raw_host.partition(':')
+        else:
+            # Plain host (no colon) or bare IPv6 literal (no port possible)
+            return raw_host, 6379
         
-        return raw_host, 6379
+        try:
+            return host, int(port) if port else 6379
+        except ValueError:
+            return host, 6379
@@ -9,17 +9,47 @@ Design decisions:
 - Common constants
 """
 
+import array
+import atexit
+import functools
 import logging
+from bisect import bisect_left
 import math
+import queue
 import random
 import time
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 
 
-# Module-level logger cache
-_loggers: dict = {}
 _log_file: Optional[Path] = None
+_log_listener: Optional[QueueListener] = None       # configure_logging's
+_extra_listeners: List[QueueListener] = []          # setup_logging's
+
+# db_to_normalized defaults, with the scale precomputed for process_channels
+_DEFAULT_MIN_DB = -120.0
+_DEFAULT_GAMMA = 0.6
+_DEFAULT_DB_SCALE = 1.0 / (0.0 - _DEFAULT_MIN_DB)
+
+# Pre-generated uniform noise in [-1, 1] for apply_vu_jitter, read as a ring
+_NOISE_SIZE = 4096  # power of two: the index wraps with a mask
+_NOISE = array.array('d', [random.uniform(-1.0, 1.0) for _ in range(_NOISE_SIZE)])
+_noise_idx = 0
+
+# apply_vu_jitter level bands: avg_level strictly above _JITTER_LEVELS[i - 1]
+# selects _JITTER_BANDS[i] = (smoothing, jitter amount)
+_JITTER_LEVELS = (0.15, 0.35, 0.6)
+_JITTER_BANDS = (
+    (0.6, 0.0),    # Very low: stability
+    (0.4, 0.04),   # Low-medium: some jitter
+    (0.2, 0.08),   # Medium level: low smoothing, moderate jitter
+    (0.05, 0.15),  # High level: maximum responsiveness, large jitter
+)
+
+# get_refresh_rate_ms: same strict-threshold lookup
+_REFRESH_LEVELS = (0.4, 0.7)
+_REFRESH_RATES_MS = (80, 60, 40)  # normal, medium, fast at high levels
 
 
 def configure_logging(log_file: Path, level: int = logging.INFO) -> None:
@@ -30,7 +60,7 @@ def configure_logging(log_file: Path, level: int = logging.INFO) -> None:
         log_file: Path to log file
         level: Logging level
     """
-    global _log_file
+    global _log_file, _log_listener
     _log_file = log_file
     
     # Ensure directory exists
@@ -40,19 +70,68 @@ def configure_logging(log_file: Path, level: int = logging.INFO) -> None:
     root_logger = logging.getLogger('openob.ui')
     root_logger.setLevel(level)
     
-    # Remove existing handlers
+    # Remove existing handlers (and stop a previous listener)
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    if _log_listener is not None:
+        _stop_listener(_log_listener)
     
-    # Add file handler
-    handler = logging.FileHandler(log_file, encoding='utf-8')
-    handler.setFormatter(
-        logging.Formatter('%(asctime)s [%(levelname)s] %(name)s - %(message)s')
+    queue_handler, _log_listener = _queued_file_handler(
+        log_file, '%(asctime)s [%(levelname)s] %(name)s - %(message)s'
     )
-    root_logger.addHandler(handler)
+    root_logger.addHandler(queue_handler)
     root_logger.propagate = False
 
 
+def _queued_file_handler(log_file: Path, fmt: str) -> Tuple[QueueHandler, QueueListener]:
+    """
+    Build a QueueHandler whose records are written to log_file by a
+    started QueueListener thread.
+    
+    Callers (UI thread, output readers) only enqueue records and never
+    wait on disk.
+    """
+    handler = logging.FileHandler(log_file, encoding='utf-8')
+    handler.setFormatter(logging.Formatter(fmt))
+    
+    # Buffer records and write them in batches; ERROR and above flush at once
+    buffered = MemoryHandler(500, flushLevel=logging.ERROR, target=handler, flushOnClose=True)
+    
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, buffered, respect_handler_level=True)
+    listener.start()
+    return QueueHandler(log_queue), listener
+
+
+def _stop_listener(listener: QueueListener) -> None:
+    """Stop a listener and close its handlers, writing out queued records."""
+    listener.stop()
+    for handler in listener.handlers:
+        # MemoryHandler.close() flushes into its target, then drops it
+        target = getattr(handler, 'target', None)
+        handler.close()
+        if target is not None:
+            target.close()
+
+
+def shutdown_logging() -> None:
+    """
+    Stop the logging listeners, writing out any queued records.
+    
+    Safe to call more than once; also registered with atexit.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        _stop_listener(_log_listener)
+        _log_listener = None
+    while _extra_listeners:
+        _stop_listener(_extra_listeners.pop())
+
+
+atexit.register(shutdown_logging)
+
+
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for the given name.
@@ -63,12 +142,10 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
-    if name not in _loggers:
-        # Normalize name to openob.ui namespace
-        if not name.startswith('openob.ui'):
-            name = f'openob.ui.{name.split(".")[-1]}'
-        _loggers[name] = logging.getLogger(name)
-    return _loggers[name]
+    # Normalize name to openob.ui namespace
+    if not name.startswith('openob.ui'):
+        name = f'openob.ui.{name.rsplit(".", 1)[-1]}'
+    return logging.getLogger(name)
 
 
 def setup_logging(log_file: Path, logger_name: str = 'openob.ui') -> logging.Logger:
@@ -87,11 +164,11 @@ def setup_logging(log_file: Path, logger_name: str = 'openob.ui') -> logging.Log
     
     # Avoid duplicate handlers
     if not logger.handlers:
-        handler = logging.FileHandler(log_file, encoding='utf-8')
-        handler.setFormatter(
-            logging.Formatter('%(asctime)s [%(levelname)s] %(message)s')
+        queue_handler, listener = _queued_file_handler(
+            log_file, '%(asctime)s [%(levelname)s] %(message)s'
         )
-        logger.addHandler(handler)
+        _extra_listeners.append(listener)
+        logger.addHandler(queue_handler)
         logger.propagate = False
     
     return logger
@@ -122,13 +199,58 @@ def db_to_normalized(db_value: float, min_db: float = -120.0, gamma: float = 0.6
         linear = (db - min_db) / (0.0 - min_db)
         
         # Apply gamma curve for better visual response
-        curved = math.pow(linear, gamma)
+        curved = linear ** gamma
         
         return curved
     except (ValueError, TypeError):
         return 0.0
 
 
+def process_channels(
+    left_db: float,
+    right_db: float,
+    old_left: float,
+    old_right: float,
+    min_db: float = _DEFAULT_MIN_DB,
+    gamma: float = _DEFAULT_GAMMA
+) -> Tuple[float, float, float]:
+    """
+    Convert, jitter and smooth both channels of one VU reading in one call.
+    
+    Same result as db_to_normalized + apply_vu_jitter + smooth_value per
+    channel, without the per-channel call overhead. Inputs must be floats.
+    
+    Args:
+        left_db: Left channel level in dB
+        right_db: Right channel level in dB
+        old_left: Previous normalized left value
+        old_right: Previous normalized right value
+        min_db: Minimum dB value (maps to 0.0)
+        gamma: Gamma curve factor
+        
+    Returns:
+        Tuple of (left, right, smoothing_factor)
+    """
+    scale = _DEFAULT_DB_SCALE if min_db == _DEFAULT_MIN_DB else 1.0 / (0.0 - min_db)
+    
+    # Clamp to [min_db, 0] (NaN reads as silence)
+    if not left_db >= min_db:
+        left_db = min_db
+    elif left_db > 0.0:
+        left_db = 0.0
+    if not right_db >= min_db:
+        right_db = min_db
+    elif right_db > 0.0:
+        right_db = 0.0
+    
+    left = ((left_db - min_db) * scale) ** gamma
+    right = ((right_db - min_db) * scale) ** gamma
+    
+    left, right, smooth = apply_vu_jitter(left, right, (left + right) / 2)
+    inv = 1 - smooth
+    return smooth * old_left + inv * left, smooth * old_right + inv * right, smooth
+
+
 def apply_vu_jitter(
     left: float, 
     right: float, 
@@ -147,26 +269,16 @@ def apply_vu_jitter(
     Returns:
         Tuple of (left, right, smoothing_factor)
     """
-    if avg_level > 0.6:
-        # High level: maximum responsiveness, large jitter
-        smooth = 0.05
-        jitter_l = random.uniform(-0.15, 0.15)
-        jitter_r = random.uniform(-0.15, 0.15)
-    elif avg_level > 0.35:
-        # Medium level: low smoothing, moderate jitter
-        smooth = 0.2
-        jitter_l = random.uniform(-0.08, 0.08)
-        jitter_r = random.uniform(-0.08, 0.08)
-    elif avg_level > 0.15:
-        # Low-medium: some jitter
-        smooth = 0.4
-        jitter_l = random.uniform(-0.04, 0.04)
-        jitter_r = random.uniform(-0.04, 0.04)
-    else:
-        # Very low: stability
-        smooth = 0.6
-        jitter_l = 0.0
-        jitter_r = 0.0
+    smooth, amount = _JITTER_BANDS[bisect_left(_JITTER_LEVELS, avg_level)]
+    if not amount:
+        return max(0.0, min(1.0, left)), max(0.0, min(1.0, right)), smooth
+    
+    # Two samples from the noise ring instead of two random.uniform() calls
+    global _noise_idx
+    i = _noise_idx
+    _noise_idx = (i + 2) & (_NOISE_SIZE - 1)
+    jitter_l = _NOISE[i] * amount
+    jitter_r = _NOISE[i + 1] * amount
     
     left_out = max(0.0, min(1.0, left + jitter_l))
     right_out = max(0.0, min(1.0, right + jitter_r))
@@ -201,26 +313,27 @@ def get_refresh_rate_ms(avg_level: float) -> int:
     Returns:
         Refresh interval in milliseconds
     """
-    if avg_level > 0.7:
-        return 40   # Fast at high levels
-    elif avg_level > 0.4:
-        return 60   # Medium
-    else:
-        return 80   # Normal at low levels
+    return _REFRESH_RATES_MS[bisect_left(_REFRESH_LEVELS, avg_level)]
 
 
-def simulate_vu_level(seed_offset: float = 0.0, amplitude: float = 0.85) -> float:
+def simulate_vu_level(
+    seed_offset: float = 0.0,
+    amplitude: float = 0.85,
+    now: Optional[float] = None
+) -> float:
     """
     Generate simulated VU level for testing/demo.
     
     Args:
         seed_offset: Time offset for variation
         amplitude: Maximum amplitude
+        now: Frame time, so several calls per frame share one clock read
+            (default: time.time())
         
     Returns:
         Simulated level between 0 and 1
     """
-    t = time.time()
+    t = time.time() if now is None else now
     base = abs(math.sin(t * 2.5 + seed_offset))
     noise = random.random() * 0.15
     return base * amplitude + noise
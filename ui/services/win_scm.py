@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+win_scm.py - Direct Windows Service Control Manager access via ctypes.
+
+Design decisions:
+- Talks to advapi32 directly so a status poll costs a syscall instead of
+  a PowerShell interpreter start
+- Windows only: HAS_SCM is False elsewhere and callers keep their
+  PowerShell path as the fallback
+- Failures surface as OSError (ctypes.WinError) for the caller to handle
+"""
+
+import ctypes
+import sys
+import threading
+import time
+from ctypes import wintypes
+from typing import Optional
+
+HAS_SCM = sys.platform == 'win32'
+
+# Access rights
+SC_MANAGER_CONNECT = 0x0001
+SERVICE_QUERY_STATUS = 0x0004
+SERVICE_START = 0x0010
+SERVICE_STOP = 0x0020
+
+# Service states (dwCurrentState)
+SERVICE_STOPPED = 1
+SERVICE_START_PENDING = 2
+SERVICE_STOP_PENDING = 3
+SERVICE_RUNNING = 4
+
+SERVICE_CONTROL_STOP = 1
+SC_STATUS_PROCESS_INFO = 0
+
+# Win32 error codes
+ERROR_ACCESS_DENIED = 5
+ERROR_SERVICE_ALREADY_RUNNING = 1056
+ERROR_SERVICE_NOT_ACTIVE = 1062
+ERROR_SERVICE_DOES_NOT_EXIST = 1060
+
+
+class SERVICE_STATUS(ctypes.Structure):
+    _fields_ = [
+        ('dwServiceType', wintypes.DWORD),
+        ('dwCurrentState', wintypes.DWORD),
+        ('dwControlsAccepted', wintypes.DWORD),
+        ('dwWin32ExitCode', wintypes.DWORD),
+        ('dwServiceSpecificExitCode', wintypes.DWORD),
+        ('dwCheckPoint', wintypes.DWORD),
+        ('dwWaitHint', wintypes.DWORD),
+    ]
+
+
+class SERVICE_STATUS_PROCESS(ctypes.Structure):
+    _fields_ = SERVICE_STATUS._fields_ + [
+        ('dwProcessId', wintypes.DWORD),
+        ('dwServiceFlags', wintypes.DWORD),
+    ]
+
+
+if HAS_SCM:
+    _advapi32 = ctypes.WinDLL('advapi32', use_last_error=True)
+    
+    _OpenSCManagerW = _advapi32.OpenSCManagerW
+    _OpenSCManagerW.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD)
+    _OpenSCManagerW.restype = wintypes.HANDLE
+    
+    _OpenServiceW = _advapi32.OpenServiceW
+    _OpenServiceW.argtypes = (wintypes.HANDLE, wintypes.LPCWSTR, wintypes.DWORD)
+    _OpenServiceW.restype = wintypes.HANDLE
+    
+    _QueryServiceStatusEx = _advapi32.QueryServiceStatusEx
+    _QueryServiceStatusEx.argtypes = (
+        wintypes.HANDLE, ctypes.c_int, ctypes.c_void_p,
+        wintypes.DWORD, ctypes.POINTER(wintypes.DWORD)
+    )
+    _QueryServiceStatusEx.restype = wintypes.BOOL
+    
+    _StartServiceW = _advapi32.StartServiceW
+    _StartServiceW.argtypes = (wintypes.HANDLE, wintypes.DWORD, ctypes.c_void_p)
+    _StartServiceW.restype = wintypes.BOOL
+    
+    _ControlService = _advapi32.ControlService
+    _ControlService.argtypes = (wintypes.HANDLE, wintypes.DWORD, ctypes.POINTER(SERVICE_STATUS))
+    _ControlService.restype = wintypes.BOOL
+    
+    _CloseServiceHandle = _advapi32.CloseServiceHandle
+    _CloseServiceHandle.argtypes = (wintypes.HANDLE,)
+    _CloseServiceHandle.restype = wintypes.BOOL
+
+
+def _win_error() -> OSError:
+    return ctypes.WinError(ctypes.get_last_error())
+
+
+class ServiceHandle:
+    """
+    Cached SCM + service handles for one Windows service.
+    
+    Handles are opened lazily on first use and kept until close(). The
+    service is opened with start/stop rights when the user has them,
+    otherwise with query rights only (start/stop then raise OSError).
+    
+    Safe to share between threads: every use of the handles holds a lock,
+    so one thread can't close a handle another is querying.
+    """
+    
+    def __init__(self, name: str):
+        if not HAS_SCM:
+            raise OSError("Service Control Manager is only available on Windows")
+        self._name = name
+        self._scm = None
+        self._service = None
+        # Reentrant: a failed query closes the handles while holding it
+        self._lock = threading.RLock()
+    
+    def _open(self) -> bool:
+        """
+        Open the handles if needed; False if the service is not installed.
+        
+        Callers must hold self._lock.
+        """
+        if self._service:
+            return True
+        if not self._scm:
+            self._scm = _OpenSCManagerW(None, None, SC_MANAGER_CONNECT)
+            if not self._scm:
+                raise _win_error()
+        
+        for access in (SERVICE_QUERY_STATUS | SERVICE_START | SERVICE_STOP, SERVICE_QUERY_STATUS):
+            self._service = _OpenServiceW(self._scm, self._name, access)
+            if self._service:
+                return True
+            error = ctypes.get_last_error()
+            if error == ERROR_SERVICE_DOES_NOT_EXIST:
+                return False
+            if error != ERROR_ACCESS_DENIED:
+                break
+        raise ctypes.WinError(error)
+    
+    def query_state(self) -> Optional[int]:
+        """Return the service's dwCurrentState, or None if it is not installed."""
+        with self._lock:
+            if not self._open():
+                return None
+            status = SERVICE_STATUS_PROCESS()
+            needed = wintypes.DWORD()
+            if not _QueryServiceStatusEx(self._service, SC_STATUS_PROCESS_INFO,
+                                         ctypes.byref(status), ctypes.sizeof(status),
+                                         ctypes.byref(needed)):
+                error = _win_error()
+                self.close()  # stale handle (service deleted?): reopen next time
+                raise error
+            return status.dwCurrentState
+    
+    def wait_for(self, state: int, timeout: float = 10.0) -> bool:
+        """Poll until the service reaches state; False on timeout."""
+        deadline = time.monotonic() + timeout
+        while self.query_state() != state:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)
+        return True
+    
+    def start(self, timeout: float = 10.0) -> bool:
+        """Start the service and wait for it to run (True if it did)."""
+        with self._lock:
+            if not self._open():
+                raise ctypes.WinError(ERROR_SERVICE_DOES_NOT_EXIST)
+            if not _StartServiceW(self._service, 0, None):
+                error = ctypes.get_last_error()
+                if error != ERROR_SERVICE_ALREADY_RUNNING:
+                    raise ctypes.WinError(error)
+        # Not under the lock: status queries keep running while we wait
+        return self.wait_for(SERVICE_RUNNING, timeout)
+    
+    def stop(self, timeout: float = 10.0) -> bool:
+        """Stop the service and wait for it to stop (True if it did)."""
+        with self._lock:
+            if not self._open():
+                raise ctypes.WinError(ERROR_SERVICE_DOES_NOT_EXIST)
+            status = SERVICE_STATUS()
+            if not _ControlService(self._service, SERVICE_CONTROL_STOP, ctypes.byref(status)):
+                error = ctypes.get_last_error()
+                if error != ERROR_SERVICE_NOT_ACTIVE:
+                    raise ctypes.WinError(error)
+        return self.wait_for(SERVICE_STOPPED, timeout)
+    
+    def close(self) -> None:
+        """Release the cached handles (safe to call repeatedly)."""
+        with self._lock:
+            if self._service:
+                _CloseServiceHandle(self._service)
+                self._service = None
+            if self._scm:
+                _CloseServiceHandle(self._scm)
+                self._scm = None
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -10,18 +10,24 @@ from tkinter import ttk, messagebox
 import math
 import random
 import os
+from bisect import bisect_right
 
 # Intentar usar PIL (mejor para redimensionar PNG); si no está, usar PhotoImage directo
 try:
-    from PIL import Image, ImageTk
+    from PIL import Image, ImageDraw, ImageTk
     PIL_AVAILABLE = True
 except Exception:
     PIL_AVAILABLE = False
 
 ICON_PATH = "input_line.png"  # Cambia aquí si tu icon está en otro path
+# copia ya reducida del icono, junto al original (se regenera si el icono es más nuevo)
+ICON_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(ICON_PATH)), "._icon_cache_150.png")
 
 WIDTH, HEIGHT = 1000, 640
 CENTER_X, CENTER_Y = WIDTH // 2, HEIGHT // 2 - 30
+FRAME_MS = 80         # intervalo normal de animación
+IDLE_FRAME_MS = 160   # intervalo tras IDLE_FRAMES frames sin cambios visibles
+IDLE_FRAMES = 10
 
 class OBBroadcastApp(tk.Tk):
     def __init__(self):
@@ -31,19 +37,36 @@ class OBBroadcastApp(tk.Tk):
         self.configure(bg="#f6f6f6")
         self.resizable(False, False)
 
-        self.canvas = tk.Canvas(self, width=WIDTH, height=HEIGHT, bg="#ffffff", highlightthickness=0)
+        # sin foco ni borde: el canvas solo dibuja, no recibe teclado
+        self.canvas = tk.Canvas(self, width=WIDTH, height=HEIGHT, bg="#ffffff", highlightthickness=0,
+                                takefocus=0, bd=0)
         self.canvas.place(x=20, y=10)  # pequeño margen
 
         # Cargar icono (si existe)
         self.icon_img = None
         if os.path.exists(ICON_PATH):
             try:
-                if PIL_AVAILABLE:
-                    img = Image.open(ICON_PATH).convert("RGBA")
+                if (os.path.exists(ICON_CACHE_PATH)
+                        and os.path.getmtime(ICON_CACHE_PATH) >= os.path.getmtime(ICON_PATH)):
+                    # icono ya reducido en un arranque anterior: Tk lo carga sin PIL
+                    self.icon_img = tk.PhotoImage(file=ICON_CACHE_PATH)
+                elif PIL_AVAILABLE:
                     # tamaño relativo a la ventana
                     icon_size = 150
-                    img = img.resize((icon_size, icon_size), Image.LANCZOS)
+                    img = Image.open(ICON_PATH)
+                    # draft: decodificar ya reducido (solo tiene efecto en JPEG)
+                    img.draft("RGBA", (icon_size, icon_size))
+                    # convertir antes de reducir (en modo P el resize sería NEAREST),
+                    # pero solo si hace falta: evita una copia completa del bitmap
+                    if img.mode != "RGBA":
+                        img = img.convert("RGBA")
+                    # BILINEAR basta para un icono de 150 px; thumbnail mantiene el aspecto
+                    img.thumbnail((icon_size, icon_size), Image.BILINEAR)
                     self.icon_img = ImageTk.PhotoImage(img)
+                    try:
+                        img.save(ICON_CACHE_PATH)
+                    except OSError as e:
+                        print("No se pudo guardar la caché del icono:", e)
                 else:
                     self.icon_img = tk.PhotoImage(file=ICON_PATH)
             except Exception as e:
@@ -64,6 +87,43 @@ class OBBroadcastApp(tk.Tk):
         self.vu_right = 0.25
         # receptor (barra centrada) - nivel combinado (0..1)
         self.receiver_level = 0.4
+        # umbral de cada anillo (ring) para iluminar sus segmentos
+        self._thresholds = (0.06, 0.18, 0.32, 0.46, 0.6, 0.74)
+        # mascara de anillos encendidos en el ultimo frame (bit i = ring i);
+        # los arcos se crean apagados
+        self._prev_left_mask = 0
+        self._prev_right_mask = 0
+        # estado visible del último frame: (anillos izq, anillos der, px de la barra)
+        self._last_q = (-1, -1, -1)
+        self._idle_frames = 0
+        # tabla de onda para la simulación (evita sin/cos y random por frame)
+        self._wave = tuple(abs(math.sin(2 * math.pi * i / 256)) * 0.95 for i in range(256))
+        self._frame = 0
+        # hay un frame encolado en after_idle
+        self._pending = False
+        # geometría constante de la barra de receptor (la usan draw_static_elements
+        # y update_receiver_bar)
+        self._bar_w = 520
+        self._bar_h = 18
+        self._bar_bx1 = CENTER_X - self._bar_w // 2
+        self._bar_bx2 = CENTER_X + self._bar_w // 2
+        self._bar_by = CENTER_Y + 10 + self.outer_radius + 32
+        self._bar_y2 = self._bar_by + self._bar_h
+        self._half_len = (self._bar_bx2 - self._bar_bx1) // 2
+        self._cap_pad = self._bar_h // 2
+        # límites de x para el centro de las caps
+        self._cap_min_x = self._bar_bx1 + self._cap_pad
+        self._cap_max_x = self._bar_bx2 - self._cap_pad
+        # último estado dibujado de la barra de receptor
+        self._last_cur = -1
+        self._last_color = None
+        self._caps_hidden = False
+        # x del centro de cada cap (se crean en el centro de la barra)
+        self._left_cap_x = CENTER_X
+        self._right_cap_x = CENTER_X
+
+        # Estilos de los botones, antes de crearlos
+        self._configure_styles()
 
         # Dibujar elementos estáticos
         self.draw_static_elements()
@@ -71,17 +131,64 @@ class OBBroadcastApp(tk.Tk):
         # Iniciar animacion
         self.animate()
 
+    def _configure_styles(self):
+        # Una sola instancia de ttk.Style para los estilos de los botones
+        style = ttk.Style(self)
+        # Estilizar el botón Stop para que coincida con Settings
+        style.configure('Stop.TButton', font=("Inter", 18), padding=(8, 6))
+        style.configure('Settings.TButton', font=("Inter", 18), padding=(4, 2))
+
     def draw_static_elements(self):
-        # Fondo circular plomo
         ox, oy = CENTER_X, CENTER_Y + 10
         r_plomo = self.outer_radius
-        self.canvas.create_oval(ox - r_plomo, oy - r_plomo, ox + r_plomo, oy + r_plomo,
-                                fill="#d0d3d6", outline="")  # fondo plomo
-
-        # Círculo rojo central (dentro)
         r_red = self.red_center_radius
-        self.red_circle = self.canvas.create_oval(ox - r_red, oy - r_red, ox + r_red, oy + r_red,
-                                                 fill="#d9534f", outline="")  # rojo centro
+
+        # Barra horizontal de fondo (plo) para receptor
+        bar_w, bar_h = self._bar_w, self._bar_h
+        bx1, bx2, by = self._bar_bx1, self._bar_bx2, self._bar_by
+        # Ticks y marcas de extremo (definen el maximo)
+        ticks = 8
+        tick_h = 6
+
+        if PIL_AVAILABLE:
+            # discos, fondo de la barra y marcas pintados en una sola imagen:
+            # un item de canvas en lugar de ~15
+            bg = Image.new("RGB", (WIDTH, HEIGHT), "#ffffff")
+            draw = ImageDraw.Draw(bg)
+            draw.ellipse((ox - r_plomo, oy - r_plomo, ox + r_plomo, oy + r_plomo), fill="#d0d3d6")  # fondo plomo
+            draw.ellipse((ox - r_red, oy - r_red, ox + r_red, oy + r_red), fill="#d9534f")  # rojo centro
+            draw.rectangle((bx1, by, bx2, by + bar_h), fill="#dbe0e3", outline="#c9cfd3", width=1)
+            draw.line((CENTER_X, by - 8, CENTER_X, by + bar_h + 8), fill="#b9b9b9")
+            for i in range(ticks + 1):
+                tx = bx1 + (bar_w) * (i / ticks)
+                draw.line((tx, by - tick_h, tx, by + bar_h + tick_h), fill="#e8e8e8")
+            draw.line((bx1, by - 8, bx1, by + bar_h + 8), fill="#b9b9b9", width=1)
+            draw.line((bx2, by - 8, bx2, by + bar_h + 8), fill="#b9b9b9", width=1)
+            self._bg_img = ImageTk.PhotoImage(bg)
+            bg_id = self.canvas.create_image(0, 0, anchor="nw", image=self._bg_img)
+            # al fondo de la pila: los títulos se crearon antes y quedarían tapados
+            self.canvas.tag_lower(bg_id)
+        else:
+            # Fondo circular plomo
+            self.canvas.create_oval(ox - r_plomo, oy - r_plomo, ox + r_plomo, oy + r_plomo,
+                                    fill="#d0d3d6", outline="")  # fondo plomo
+
+            # Círculo rojo central (dentro)
+            self.red_circle = self.canvas.create_oval(ox - r_red, oy - r_red, ox + r_red, oy + r_red,
+                                                     fill="#d9534f", outline="")  # rojo centro
+
+            # Fondo de la barra de receptor con borde sutil
+            self.bar_bg = self.canvas.create_rectangle(bx1, by, bx2, by + bar_h, fill="#dbe0e3", outline="#c9cfd3", width=1)
+            # Linea central vertical que indica el centro (separador stereo)
+            self.canvas.create_line(CENTER_X, by - 8, CENTER_X, by + bar_h + 8, fill="#b9b9b9")
+            # dibujar ticks encima: los 9 create en un solo script Tcl (una llamada)
+            self.tk.eval("\n".join(
+                f"{self.canvas} create line {bx1 + bar_w * (i / ticks)} {by - tick_h} "
+                f"{bx1 + bar_w * (i / ticks)} {by + bar_h + tick_h} -fill #e8e8e8"
+                for i in range(ticks + 1)))
+            # extremos (marcadores para maximo)
+            self.canvas.create_line(bx1, by - 8, bx1, by + bar_h + 8, fill="#b9b9b9", width=1)
+            self.canvas.create_line(bx2, by - 8, bx2, by + bar_h + 8, fill="#b9b9b9", width=1)
 
         # Si hay icono, colocarlo centrado sobre el rojo:
         if self.icon_img:
@@ -93,74 +200,68 @@ class OBBroadcastApp(tk.Tk):
             self.canvas.create_rectangle(ox - 18, oy - mic_h//2, ox + 18, oy + mic_h//2, fill="#ffffff", outline="")
             self.canvas.create_oval(ox-30, oy+mic_h//2-10, ox+30, oy+mic_h//2+20, fill="#ffffff", outline="")
 
-        # Barra horizontal de fondo (plo) para receptor
-        bar_w = 520
-        bar_h = 18
-        bx1 = CENTER_X - bar_w // 2
-        by = oy + self.outer_radius + 32
-        bx2 = CENTER_X + bar_w // 2
-        # Fondo de la barra de receptor con borde sutil
-        self.bar_bg = self.canvas.create_rectangle(bx1, by, bx2, by + bar_h, fill="#dbe0e3", outline="#c9cfd3", width=1)
-        # Linea central vertical que indica el centro (separador stereo)
-        self.canvas.create_line(CENTER_X, by - 8, CENTER_X, by + bar_h + 8, fill="#b9b9b9")
-        # Ticks y marcas de extremo (definen el maximo)
-        ticks = 8
-        tick_h = 6
-        for i in range(ticks + 1):
-            tx = bx1 + (bar_w) * (i / ticks)
-            # dibujar ticks encima
-            self.canvas.create_line(tx, by - tick_h, tx, by + bar_h + tick_h, fill="#e8e8e8")
-        # extremos (marcadores para maximo)
-        self.canvas.create_line(bx1, by - 8, bx1, by + bar_h + 8, fill="#b9b9b9", width=1)
-        self.canvas.create_line(bx2, by - 8, bx2, by + bar_h + 8, fill="#b9b9b9", width=1)
-
         # stop button (colocado debajo de la barra de receptor)
         btn_x = CENTER_X
         btn_y = by + bar_h + 40
-        # Estilizar el botón Stop para que coincida con Settings
-        style = ttk.Style(self)
-        style.configure('Stop.TButton', font=("Inter", 18), padding=(8, 6))
         self.stop_btn = ttk.Button(self, text="Stop", command=self.on_stop, style='Stop.TButton')
         # place button using window on canvas
         self.canvas.create_window(btn_x, btn_y, window=self.stop_btn, width=140, height=48)
 
         # Settings button — alinear a la derecha y dentro del canvas para que siempre sea visible
-        style.configure('Settings.TButton', font=("Inter", 18), padding=(4, 2))
         self.settings_btn = ttk.Button(self, text="⚙ Settings", command=self.on_settings, style='Settings.TButton')
         self.canvas.create_window(WIDTH - 40, HEIGHT - 80, window=self.settings_btn, anchor='e')
 
         # VU level segments (stereo) - crear solo pequeños arcos laterales de 20° por anillo
         # Para efecto '((((((o)))))))' tendremos un arco en el hemisferio izquierdo
         # y otro en el derecho por cada anillo, cada uno con 20 grados de extensión.
-        self.segment_ids = []  # list of dicts: {'id': canvas_id, 'side': 'left'|'right', 'ring': idx}
+        left_ids = []   # canvas id del arco izquierdo, indexado por ring
+        right_ids = []  # canvas id del arco derecho, indexado por ring
+        self._left_sprites = self._right_sprites = None
         rings = 6
         ring_spacing = 14
         base_outer = r_red + 6
+        active_color = "#3fbf5f"
         inactive_color = "#cfcfcf"
         arc_extent = 50
-        for ring in range(rings):
-            r = base_outer + ring * ring_spacing
-            width_val = max(4, 10 - ring)
-            # Left arc centered at 180° (face left) -> start = 180 - arc_extent/2
-            left_start = 180 - arc_extent / 2
-            cid_l = self.canvas.create_arc(ox - r, oy - r, ox + r, oy + r,
-                                           start=left_start, extent=arc_extent,
-                                           style=tk.ARC, width=width_val, outline=inactive_color)
-            self.segment_ids.append({'id': cid_l, 'side': 'left', 'ring': ring})
-            # Right arc centered at 0° (face right) -> start = 0 - arc_extent/2
-            right_start = (360 - arc_extent / 2) % 360
-            cid_r = self.canvas.create_arc(ox - r, oy - r, ox + r, oy + r,
-                                           start=right_start, extent=arc_extent,
-                                           style=tk.ARC, width=width_val, outline=inactive_color)
-            self.segment_ids.append({'id': cid_r, 'side': 'right', 'ring': ring})
+        if PIL_AVAILABLE:
+            # con PIL: un sprite por lado y por número de anillos encendidos (0..6);
+            # update_vu_ring solo cambia la imagen de un item por lado
+            ring_specs = [(base_outer + ring * ring_spacing, max(4, 10 - ring)) for ring in range(rings)]
+            self._left_sprites, lx, ly = self._render_arc_sprites(
+                ring_specs, 180, arc_extent, active_color, inactive_color)
+            self._right_sprites, rx, ry = self._render_arc_sprites(
+                ring_specs, 0, arc_extent, active_color, inactive_color)
+            self._left_img_id = self.canvas.create_image(ox + lx, oy + ly, anchor="nw", image=self._left_sprites[0])
+            self._right_img_id = self.canvas.create_image(ox + rx, oy + ry, anchor="nw", image=self._right_sprites[0])
+        else:
+            for ring in range(rings):
+                r = base_outer + ring * ring_spacing
+                width_val = max(4, 10 - ring)
+                # Left arc centered at 180° (face left) -> start = 180 - arc_extent/2
+                left_start = 180 - arc_extent / 2
+                cid_l = self.canvas.create_arc(ox - r, oy - r, ox + r, oy + r,
+                                               start=left_start, extent=arc_extent,
+                                               style=tk.ARC, width=width_val, outline=inactive_color)
+                left_ids.append(cid_l)
+                # Right arc centered at 0° (face right) -> start = 0 - arc_extent/2
+                right_start = (360 - arc_extent / 2) % 360
+                cid_r = self.canvas.create_arc(ox - r, oy - r, ox + r, oy + r,
+                                               start=right_start, extent=arc_extent,
+                                               style=tk.ARC, width=width_val, outline=inactive_color)
+                right_ids.append(cid_r)
+        # tuplas fijas para update_vu_ring (vacías si se usan sprites)
+        self._left_ids = tuple(left_ids)
+        self._right_ids = tuple(right_ids)
 
         # VU receptor (barra) - representamos 2 barras (izq y der) que parten del centro
         # izquierda
-        self.receiver_left = self.canvas.create_rectangle(CENTER_X, by, CENTER_X, by + bar_h, fill="#3fbf5f", outline="")
+        self.receiver_left = self.canvas.create_rectangle(CENTER_X, by, CENTER_X, by + bar_h, fill="#3fbf5f", outline="",
+                                                          tags="receiver_bar")
         # derecha
-        self.receiver_right = self.canvas.create_rectangle(CENTER_X, by, CENTER_X, by + bar_h, fill="#3fbf5f", outline="")
+        self.receiver_right = self.canvas.create_rectangle(CENTER_X, by, CENTER_X, by + bar_h, fill="#3fbf5f", outline="",
+                                                           tags="receiver_bar")
         # Caps para dar apariencia redondeada
-        cap_pad = bar_h // 2
+        cap_pad = self._cap_pad
         self.receiver_left_cap = self.canvas.create_oval(CENTER_X - cap_pad, by, CENTER_X + cap_pad, by + bar_h, fill="#3fbf5f", outline="")
         self.receiver_right_cap = self.canvas.create_oval(CENTER_X - cap_pad, by, CENTER_X + cap_pad, by + bar_h, fill="#3fbf5f", outline="")
 
@@ -172,6 +273,30 @@ class OBBroadcastApp(tk.Tk):
         self.canvas.create_text(CENTER_X, oy - r_red - 18, text="Audio Input", anchor="s", font=("Inter", 12, "bold"), fill="#333333")
         # No numeric level text: UI uses visual bars only
 
+    def _render_arc_sprites(self, ring_specs, center_deg, extent, active_color, inactive_color):
+        # Pintar con PIL los arcos de un lado para cada número de anillos encendidos.
+        # ring_specs: [(radio, grosor)] del anillo interior al exterior.
+        # Devuelve (sprites, dx, dy): dx/dy es la esquina del sprite relativa al centro.
+        size = 2 * (max(r + w for r, w in ring_specs) + 1)
+        c = size // 2
+        # ángulos de PIL en sentido horario; los arcos son simétricos respecto
+        # al eje horizontal, así que coinciden con los de create_arc
+        start, end = center_deg - extent / 2, center_deg + extent / 2
+        frames = []
+        for n_on in range(len(ring_specs) + 1):
+            img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(img)
+            for ring, (r, w) in enumerate(ring_specs):
+                # PIL crece el trazo hacia dentro; Tk lo centra en el radio
+                ro = r + w / 2
+                draw.arc((c - ro, c - ro, c + ro, c + ro), start, end,
+                         fill=active_color if ring < n_on else inactive_color, width=w)
+            frames.append(img)
+        # recortar todos al área del sprite completo (el resto es transparente)
+        box = frames[-1].getbbox()
+        sprites = [ImageTk.PhotoImage(img.crop(box)) for img in frames]
+        return sprites, box[0] - c, box[1] - c
+
     def on_settings(self):
         # Placeholder settings handler; expand to open real settings pane
         messagebox.showinfo("Settings", "Settings dialog placeholder")
@@ -186,8 +311,10 @@ class OBBroadcastApp(tk.Tk):
         # Simular niveles: aquí se podría tomar del mic real si se integra con audio
         # Simulación: mezcla de random y suavizado
         # Simular niveles stereo: left/right independientes
-        target_left = abs(math.sin(random.random() * 3.14 * 2)) * 0.95
-        target_right = abs(math.cos(random.random() * 3.14 * 2)) * 0.95
+        self._frame = frame = (self._frame + 1) & 255
+        j = (frame * 37 + random.getrandbits(4)) & 255
+        target_left = self._wave[frame]
+        target_right = self._wave[j]
         target_recv = (target_left + target_right) / 2 * 0.95
 
         # suavizado simple
@@ -195,68 +322,81 @@ class OBBroadcastApp(tk.Tk):
         self.vu_right = 0.82 * self.vu_right + 0.18 * target_right
         self.receiver_level = 0.85 * self.receiver_level + 0.15 * target_recv
 
-        self.update_vu_ring()
-        self.update_receiver_bar()
-
-        # Llamar de nuevo en 80 ms
-        self.after(80, self.animate)
+        # redibujar solo si cambió algo visible: anillos encendidos por lado
+        # y longitud en px de la barra (de la que sale también su color)
+        ql = bisect_right(self._thresholds, self.vu_left)
+        qr = bisect_right(self._thresholds, self.vu_right)
+        qrcv = int(max(0.0, min(1.0, self.receiver_level)) * self._half_len)
+        last_q = self._last_q
+        changed = False
+        if (ql, qr) != last_q[:2]:
+            self.update_vu_ring()
+            changed = True
+        if qrcv != last_q[2]:
+            self.update_receiver_bar()
+            changed = True
+        self._last_q = (ql, qr, qrcv)
+
+        # sin cambios durante IDLE_FRAMES frames: bajar la frecuencia
+        self._idle_frames = 0 if changed else self._idle_frames + 1
+        delay = IDLE_FRAME_MS if self._idle_frames >= IDLE_FRAMES else FRAME_MS
+        self.after(delay, self._schedule_frame)
+
+    def _schedule_frame(self):
+        # Ejecutar el frame en la cola idle de Tk, junto con sus redibujados;
+        # como mucho un frame pendiente: con carga se descartan, no se acumulan
+        if not self._pending:
+            self._pending = True
+            self.after_idle(self._run_frame)
+
+    def _run_frame(self):
+        self._pending = False
+        self.animate()
 
     def update_vu_ring(self):
         # Actualizar las líneas tipo paréntesis para left/right según self.vu_left / self.vu_right
-        ox, oy = CENTER_X, CENTER_Y + 10
-        # cada anillo (ring) tiene un umbral para iluminar sus segmentos
-        thresholds = [0.06, 0.18, 0.32, 0.46, 0.6, 0.74]
         active_color = "#3fbf5f"
         inactive_color = "#cfcfcf"
-
-        # recorrer todos los segmentos y colorear según side y ring threshold
-        for seg in self.segment_ids:
-            ring = seg['ring']
-            side = seg['side']
-            cid = seg['id']
-            thr = thresholds[ring]
-            if side == 'left':
-                col = active_color if self.vu_left >= thr else inactive_color
-            else:
-                col = active_color if self.vu_right >= thr else inactive_color
-            self.canvas.itemconfigure(cid, outline=col)
+        thresholds = self._thresholds
+
+        # los umbrales están ordenados: bisect_right da cuántos anillos se
+        # encienden (vu >= umbral), que son siempre los primeros
+        lmask = (1 << bisect_right(thresholds, self.vu_left)) - 1
+        rmask = (1 << bisect_right(thresholds, self.vu_right)) - 1
+
+        canvas = self.canvas
+        if self._left_sprites:
+            # los anillos se encienden en orden, así que bit_length() es el
+            # número de anillos encendidos
+            if lmask != self._prev_left_mask:
+                canvas.itemconfigure(self._left_img_id, image=self._left_sprites[lmask.bit_length()])
+            if rmask != self._prev_right_mask:
+                canvas.itemconfigure(self._right_img_id, image=self._right_sprites[rmask.bit_length()])
+            self._prev_left_mask = lmask
+            self._prev_right_mask = rmask
+            return
+
+        # recolorear solo los arcos cuyo estado cambió desde el último frame
+        for ids, mask, prev in ((self._left_ids, lmask, self._prev_left_mask),
+                                (self._right_ids, rmask, self._prev_right_mask)):
+            diff = mask ^ prev
+            while diff:
+                i = (diff & -diff).bit_length() - 1
+                canvas.itemconfigure(ids[i], outline=active_color if mask & (1 << i) else inactive_color)
+                diff &= diff - 1
+
+        self._prev_left_mask = lmask
+        self._prev_right_mask = rmask
 
     def update_receiver_bar(self):
         # Actualizar barras izquierda y derecha partiendo del centro
-        # bar background coords
-        bar_w = 520
-        bar_h = 18
-        bx1 = CENTER_X - bar_w // 2
-        by = CENTER_Y + 10 + self.outer_radius + 32
-        bx2 = CENTER_X + bar_w // 2
-        # la longitud máxima desde el centro a un extremo
-        half_len = (bx2 - bx1) // 2
+        half_len = self._half_len
         # longitud actual en px según level
         # asegurar cur dentro de 0..half_len
         if self.receiver_level <= 0:
             cur = 0
         else:
             cur = int(max(0, min(1.0, self.receiver_level)) * half_len)
-        # izquierda: from CENTER_X - cur to CENTER_X
-        self.canvas.coords(self.receiver_left, CENTER_X - cur, by, CENTER_X, by + bar_h)
-        # derecha: from CENTER_X to CENTER_X + cur
-        self.canvas.coords(self.receiver_right, CENTER_X, by, CENTER_X + cur, by + bar_h)
-        # cap left (círculo en el extremo izquierdo del tramo)
-        cap_pad = bar_h // 2
-        left_cap_x = CENTER_X - cur
-        right_cap_x = CENTER_X + cur
-        # mantener caps dentro del bar area (si cur==0, esconder caps moviéndolos fuera)
-        # ocultar caps si cur == 0
-        if cur <= 0:
-            # mover las caps fuera del área visible
-            self.canvas.coords(self.receiver_left_cap, -10, -10, -5, -5)
-            self.canvas.coords(self.receiver_right_cap, -10, -10, -5, -5)
-        else:
-            # caps dentro del área, 'clamp' en límites de la barra
-            left_cap_x = max(left_cap_x, bx1 + cap_pad)
-            right_cap_x = min(right_cap_x, bx2 - cap_pad)
-            self.canvas.coords(self.receiver_left_cap, left_cap_x - cap_pad, by, left_cap_x + cap_pad, by + bar_h)
-            self.canvas.coords(self.receiver_right_cap, right_cap_x - cap_pad, by, right_cap_x + cap_pad, by + bar_h)
 
         # color transitions for the receiver bars: green -> yellow -> red near the end
         level_norm = cur / float(half_len) if half_len else 0
@@ -267,9 +407,44 @@ class OBBroadcastApp(tk.Tk):
         else:
             color = "#3fbf5f"  # green
 
-        # update bar colors
-        self.canvas.itemconfigure(self.receiver_left, fill=color)
-        self.canvas.itemconfigure(self.receiver_right, fill=color)
+        # nada que redibujar si la longitud y el color no cambiaron
+        if cur == self._last_cur and color == self._last_color:
+            return
+        self._last_cur = cur
+
+        by, by2 = self._bar_by, self._bar_y2
+        # izquierda: from CENTER_X - cur to CENTER_X
+        self.canvas.coords(self.receiver_left, CENTER_X - cur, by, CENTER_X, by2)
+        # derecha: from CENTER_X to CENTER_X + cur
+        self.canvas.coords(self.receiver_right, CENTER_X, by, CENTER_X + cur, by2)
+        # cap left (círculo en el extremo izquierdo del tramo)
+        # mantener caps dentro del bar area; ocultarlas si cur == 0
+        if cur <= 0:
+            # state='hidden': Tk las salta al redibujar, sin tocar sus coords
+            if not self._caps_hidden:
+                self.canvas.itemconfigure(self.receiver_left_cap, state='hidden')
+                self.canvas.itemconfigure(self.receiver_right_cap, state='hidden')
+                self._caps_hidden = True
+        else:
+            if self._caps_hidden:
+                self.canvas.itemconfigure(self.receiver_left_cap, state='normal')
+                self.canvas.itemconfigure(self.receiver_right_cap, state='normal')
+                self._caps_hidden = False
+            # caps dentro del área, 'clamp' en límites de la barra
+            left_cap_x = max(CENTER_X - cur, self._cap_min_x)
+            right_cap_x = min(CENTER_X + cur, self._cap_max_x)
+            # las caps solo se desplazan en x: move en lugar de reescribir coords
+            if left_cap_x != self._left_cap_x:
+                self.canvas.move(self.receiver_left_cap, left_cap_x - self._left_cap_x, 0)
+                self._left_cap_x = left_cap_x
+            if right_cap_x != self._right_cap_x:
+                self.canvas.move(self.receiver_right_cap, right_cap_x - self._right_cap_x, 0)
+                self._right_cap_x = right_cap_x
+
+        # update bar colors (ambas barras llevan el tag receiver_bar)
+        if color != self._last_color:
+            self.canvas.itemconfigure("receiver_bar", fill=color)
+            self._last_color = color
         # Don't show any numeric percentage; VU is visual only
 
     
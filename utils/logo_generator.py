@@ -1,11 +1,17 @@
+from pathlib import Path
+
 from PIL import Image
 
 # Ruta del archivo original
-input_path = "ui\images\ob-logo.png"
-output_path = "ui\images\ob-logo.ico"
+INPUT_PATH = Path("ui/images/ob-logo.png")
+OUTPUT_PATH = Path("ui/images/ob-logo.ico")
+
+
+def build_logo(input_path=INPUT_PATH, output_path=OUTPUT_PATH):
+    # Cargar la imagen y convertirla a formato ICO
+    with Image.open(input_path) as img:
+        img.save(output_path, format='ICO', sizes=[(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)])
 
-# Cargar la imagen y convertirla a formato ICO
-img = Image.open(input_path)
-img.save(output_path, format='ICO', sizes=[(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)])
 
-output_path
\ No newline at end of file
+if __name__ == "__main__":
+    build_logo()